@@ -1,19 +1,555 @@
+from __future__ import annotations
+
 import json
 import argparse
 import sys
 import os
-from typing import Dict, List, Any, Optional
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
+import re
+import io
+import glob
+import time
+import hashlib
+import shutil
+import threading
+import signal
+import itertools
+from contextlib import contextmanager, nullcontext
+from json.decoder import scanstring
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Sequence, Tuple, IO, BinaryIO, Callable, Union
+
+__version__ = "2.0"
+
+# Exit codes
+EXIT_OK = 0
+EXIT_UNEXPECTED_ERROR = 1
+EXIT_USAGE_ERROR = 2
+EXIT_INPUT_NOT_FOUND = 3
+EXIT_INVALID_JSON = 4
+EXIT_RENDER_FAILED = 5
+EXIT_BATCH_FAILURES = 6
+
+# Incremental JSON reading
+JSON_STREAM_CHUNK_SIZE = 64 * 1024
+_JSON_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_JSON_NUMBER = re.compile(r'(-?(?:0|[1-9]\d*))(\.\d+)?([eE][-+]?\d+)?')
+_JSON_NUMBER_CHARS = re.compile(r'[0-9.eE+\-]*')
+_JSON_LITERALS = (
+    ('true', True), ('false', False), ('null', None),
+    ('NaN', float('nan')), ('Infinity', float('inf')), ('-Infinity', float('-inf')),
+)
+
+# Large table layout
+LARGE_TABLE_ROWS = 500
+MIN_TABLE_ROW_HEIGHT = 12
+COLUMN_WIDTH_SAMPLE_ROWS = 200
+TABLE_CELL_FONT_SIZE = 10
+TABLE_CELL_PADDING = 12
+TABLE_FORMAT_BATCH_ROWS = 4096
+
+# Plain text layout
+TEXT_BLOCK_LINES = 200
+
+# Flowables buffered ahead of layout in incremental builds
+INCREMENTAL_BUFFER_FLOWABLES = 32
+
+# JSON Lines records read ahead to choose table columns
+JSONL_LOOKAHEAD_LINES = 1000
+
+# Collapsed deep objects
+COLLAPSE_SUMMARY_LINES = 10
+
+# Watch mode
+WATCH_POLL_SECONDS = 1.0
+WATCH_DEBOUNCE_SECONDS = 0.5
+
+# Structure profiling
+MAX_PROFILE_PATHS = 10000
+MAX_PROFILE_KEYS = 200
+OVERFLOW_PROFILE_PATH = '<other paths>'
+ESTIMATED_TABLE_ROWS_PER_PAGE = 40
+
+# Output cache
+DEFAULT_CACHE_BYTES = 1024 * 1024 * 1024
 
 def format_currency(amount: float) -> str:
     """Format currency with commas"""
     return f"{amount:,}"
 
+# Batch cell formatters: each turns a whole column of values into cell text
+_NUMERIC_CELL_TYPES = {int, float, type(None)}
+_STRING_CELL_TYPES = {str, type(None)}
+
+def _format_text_column(values: List[Any]) -> List[str]:
+    try:
+        return [str(value) if value else '' for value in values]
+    except RecursionError:
+        return [format_value(value) if value else '' for value in values]
+
+def _format_string_column(values: List[Any]) -> List[str]:
+    return [value or '' for value in values]
+
+def _format_money_column(values: List[Any]) -> List[str]:
+    return [f"${value:,}" if value else '' for value in values]
+
+def _format_mixed_money_column(values: List[Any]) -> List[str]:
+    return [f"${value:,}" if value and type(value) in (int, float) else (format_value(value) if value else '')
+            for value in values]
+
+def column_formatter(header: str, types: Optional[set] = None) -> Callable[[List[Any]], List[str]]:
+    """
+    Choose the batch formatter for a table column once, instead of per cell.
+
+    Numbers in 'cost' and 'budget' columns are shown as currency. When the
+    set of value `types` in the column is known, columns holding only numbers
+    or only strings get a formatter without per-cell type checks.
+    """
+    name = str(header).lower()
+    if 'cost' in name or 'budget' in name:
+        if types is not None and types <= _NUMERIC_CELL_TYPES:
+            return _format_money_column
+        return _format_mixed_money_column
+    if types is not None and types <= _STRING_CELL_TYPES:
+        return _format_string_column
+    return _format_text_column
+
+def format_table_rows(items: List[Dict], headers: List[str]) -> List[Tuple[str, ...]]:
+    """
+    Format dict items into table rows, with one batched formatter pass per column.
+
+    Rows are tuples, which are cheaper to build than lists and which the
+    garbage collector stops tracking, so huge tables do not slow collection.
+    """
+    columns = []
+    for header in headers:
+        # Missing keys read as None, which renders as an empty cell
+        values = [item.get(header) for item in items]
+        columns.append(column_formatter(header, set(map(type, values)))(values))
+    return list(zip(*columns))
+
+def iter_leaf_paths(data: Any) -> Iterator[Tuple[str, Any, int]]:
+    """
+    Yield (key path, value, depth) for every leaf below data, in document order.
+
+    Paths look like `owner.contacts[0].email`. Empty objects and arrays count
+    as leaves. The walk uses an explicit stack, so any depth works.
+    """
+    stack: List[Tuple[str, Any, int]] = [('', data, 0)]
+    while stack:
+        path, node, depth = stack.pop()
+        if isinstance(node, dict) and node:
+            stack.extend((f"{path}.{key}" if path else str(key), child, depth + 1)
+                         for key, child in reversed(list(node.items())))
+        elif isinstance(node, list) and node:
+            stack.extend((f"{path}[{index}]", node[index], depth + 1)
+                         for index in range(len(node) - 1, -1, -1))
+        else:
+            yield path, node, depth
+
+def format_value(value: Any) -> str:
+    """
+    Text for a value in a list item or table cell, as str() shows it.
+
+    Nested objects and arrays too deep for str() are written out with an
+    explicit stack instead, so any depth works.
+    """
+    if not isinstance(value, (dict, list)):
+        return str(value)
+    try:
+        return str(value)
+    except RecursionError:
+        pass
+    parts: List[str] = []
+    # Entries are (text to emit as is, None) or (None, value still to write out)
+    stack: List[Tuple[Optional[str], Any]] = [(None, value)]
+    while stack:
+        text, node = stack.pop()
+        if text is not None:
+            parts.append(text)
+        elif isinstance(node, list):
+            stack.append((']', None))
+            for index in range(len(node) - 1, -1, -1):
+                stack.append((None, node[index]))
+                if index:
+                    stack.append((', ', None))
+            stack.append(('[', None))
+        elif isinstance(node, dict):
+            stack.append(('}', None))
+            for index, (key, child) in enumerate(reversed(list(node.items()))):
+                if index:
+                    stack.append((', ', None))
+                stack.extend(((None, child), (f"{key!r}: ", None)))
+            stack.append(('{', None))
+        else:
+            parts.append(repr(node))
+    return ''.join(parts)
+
+def format_leaf(value: Any) -> str:
+    """Text for a leaf value in a collapsed object"""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return str(value)
+
+def plain_text(text: str) -> str:
+    """Collapse whitespace runs to single spaces, as paragraph rendering does"""
+    return ' '.join(text.split())
+
+def compute_column_widths(table_data: List[Sequence[str]], header_font_size: int,
+                          avail_width: float) -> List[float]:
+    """Measure fixed column widths from the header row and a sample of data rows"""
+    sample = table_data[1:1 + COLUMN_WIDTH_SAMPLE_ROWS]
+    widths = []
+    for col, header in enumerate(table_data[0]):
+        width = stringWidth(str(header), 'Helvetica-Bold', header_font_size)
+        for row in sample:
+            for line in row[col].split('\n'):
+                width = max(width, stringWidth(line, 'Helvetica', TABLE_CELL_FONT_SIZE))
+        widths.append(width + TABLE_CELL_PADDING)
+
+    # Shrink proportionally so the table never runs off the page
+    total = sum(widths)
+    if total > avail_width:
+        widths = [width * avail_width / total for width in widths]
+    return widths
+
+# reportlab names, bound by _import_reportlab() on the first render
+ChunkedTable = None
+StreamingTable = None
+TextBlock = None
+IncrementalDocTemplate = None
+
+def _import_reportlab() -> None:
+    """
+    Import reportlab and define the flowables built on it.
+
+    Deferred until something is rendered, so --help, --version and --preview
+    start without paying for the reportlab import.
+    """
+    global letter, A4, SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Flowable
+    global getSampleStyleSheet, ParagraphStyle, stringWidth, simpleSplit, colors, TA_CENTER
+    global ChunkedTable, StreamingTable, TextBlock, IncrementalDocTemplate
+    if ChunkedTable is not None:
+        return
+
+    from reportlab.lib.pagesizes import letter, A4
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, Flowable
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+    from reportlab.pdfbase.pdfmetrics import stringWidth
+    from reportlab.lib.utils import simpleSplit
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.platypus import Frame, PageTemplate
+    from reportlab.pdfbase import pdfdoc
+    from reportlab import rl_config
+
+    # Bound as module globals through the declarations above
+    class ChunkedTable(Flowable):
+        """
+        A long table laid out one page-sized Table at a time.
+
+        Splitting one huge Table re-measures every remaining row on each page, so
+        layout time grows quadratically with the row count. This flowable only
+        builds a Table for the rows that can fit in the space it is offered, using
+        fixed column widths and repeating the header row at the top of each page.
+        """
+
+        def __init__(self, table_data: List[Sequence[str]], col_widths: List[float],
+                     style: TableStyle, start: int = 1):
+            Flowable.__init__(self)
+            self.table_data = table_data
+            self.col_widths = col_widths
+            self.style = style
+            self.start = start
+            self._table = None
+
+        def _build_chunk(self, avail_height: float) -> Table:
+            """Build a Table holding at least as many rows as fit in avail_height"""
+            end = self.start + int(avail_height // MIN_TABLE_ROW_HEIGHT) + 1
+            table = Table([self.table_data[0]] + self.table_data[self.start:end],
+                          colWidths=self.col_widths, repeatRows=1)
+            table.setStyle(self.style)
+            return table
+
+        def wrap(self, availWidth, availHeight):
+            self._table = self._build_chunk(availHeight)
+            self.width, self.height = self._table.wrap(availWidth, availHeight)
+            return self.width, self.height
+
+        def split(self, availWidth, availHeight):
+            table = self._build_chunk(availHeight)
+            if table.wrap(availWidth, availHeight)[1] <= availHeight:
+                parts = [table]
+            else:
+                parts = table.split(availWidth, availHeight)
+            if not parts:
+                return []
+
+            rest = self.start + len(parts[0]._rowHeights) - 1
+            if rest >= len(self.table_data):
+                return [parts[0]]
+            return [parts[0], type(self)(self.table_data, self.col_widths, self.style, rest)]
+
+        def draw(self):
+            self._table.drawOn(self.canv, 0, 0)
+
+    class StreamingTable(Flowable):
+        """
+        A table whose rows are pulled from an iterator as pages are laid out.
+
+        Like ChunkedTable it builds one page-sized Table at a time with fixed
+        column widths and the header repeated on each page, but only the rows
+        of the page being laid out are held in memory.
+        """
+
+        def __init__(self, header: Sequence[str], rows: Iterator[Sequence[str]], col_widths: List[float],
+                     style: TableStyle, buffered: Optional[List[Sequence[str]]] = None):
+            Flowable.__init__(self)
+            self.header = header
+            self.rows = rows
+            self.col_widths = col_widths
+            self.style = style
+            # Rows pulled from the iterator but not placed yet
+            self.buffered = buffered if buffered is not None else []
+            self._table = None
+
+        def _build_chunk(self, avail_height: float) -> Table:
+            """Build a Table holding at least as many rows as fit in avail_height"""
+            count = int(avail_height // MIN_TABLE_ROW_HEIGHT) + 1
+            if len(self.buffered) < count:
+                self.buffered.extend(itertools.islice(self.rows, count - len(self.buffered)))
+            table = Table([self.header] + self.buffered[:count], colWidths=self.col_widths, repeatRows=1)
+            table.setStyle(self.style)
+            return table
+
+        def wrap(self, availWidth, availHeight):
+            self._table = self._build_chunk(availHeight)
+            self.width, self.height = self._table.wrap(availWidth, availHeight)
+            return self.width, self.height
+
+        def split(self, availWidth, availHeight):
+            table = self._build_chunk(availHeight)
+            if table.wrap(availWidth, availHeight)[1] <= availHeight:
+                parts = [table]
+            else:
+                parts = table.split(availWidth, availHeight)
+            if not parts:
+                return []
+
+            rest = self.buffered[len(parts[0]._rowHeights) - 1:]
+            if not rest:
+                rest = list(itertools.islice(self.rows, 1))
+                if not rest:
+                    return [parts[0]]
+            return [parts[0], type(self)(self.header, self.rows, self.col_widths, self.style, rest)]
+
+        def draw(self):
+            self._table.drawOn(self.canv, 0, 0)
+
+    class IncrementalDocTemplate(SimpleDocTemplate):
+        """
+        A document template that can lay out flowables pulled from an iterator.
+
+        build() needs the whole story as a list. build_incremental() keeps only
+        a few flowables buffered, so each one is released once it is placed,
+        and writes every finished page, with its compressed content stream,
+        straight to the output. Only object numbers and offsets are kept for
+        the cross-reference table, which write_pdf() adds with the remaining
+        objects (fonts, page tree, catalog) at the end.
+
+        A StreamingTable reads its rows from the same input as the flowables
+        after it, so nothing more is pulled until it has been placed.
+        """
+
+        # PDFFile writing to the output while pages are built incrementally
+        _pdf_file = None
+
+        def build_incremental(self, flowables: Iterable[Flowable]) -> None:
+            """Lay out flowables from an iterator, topping up a small buffer as they are consumed"""
+            source = iter(flowables)
+            # The page templates SimpleDocTemplate.build() would set up
+            self._calc()
+            frame = Frame(self.leftMargin, self.bottomMargin, self.width, self.height, id='normal')
+            self.addPageTemplates([PageTemplate(id='First', frames=frame, pagesize=self.pagesize),
+                                   PageTemplate(id='Later', frames=frame, pagesize=self.pagesize)])
+            self._startBuild()
+            canv = self.canv
+            saved_info = canv._doc.info
+            self._start_output()
+            canv.setPageCallBack(self._write_page)
+            try:
+                canv._doctemplate = self
+                pending: List[Flowable] = []
+                while True:
+                    if (len(pending) < INCREMENTAL_BUFFER_FLOWABLES
+                            and not any(isinstance(flowable, StreamingTable) for flowable in pending)):
+                        for flowable in source:
+                            pending.append(flowable)
+                            if (isinstance(flowable, StreamingTable)
+                                    or len(pending) >= INCREMENTAL_BUFFER_FLOWABLES):
+                                break
+                        if not pending:
+                            break
+                    self.clean_hanging()
+                    self.handle_flowable(pending)
+                del canv._doctemplate
+                canv._doc.info = saved_info
+                self._endBuild()
+            except BaseException:
+                self._discard_output()
+                raise
+
+        def write_pdf(self) -> None:
+            """Write the PDF, or what is left of it when the pages were written as they were finished"""
+            pdf_file = self._pdf_file
+            if pdf_file is None:
+                self.canv.save()
+                return
+            canv = self.canv
+            doc = canv._doc
+            try:
+                if canv._code:
+                    canv.showPage()
+                # What PDFDocument.GetPDFData() and format() do, minus the pages already written
+                for font in doc.delayedFonts:
+                    font.addObjects(doc)
+                doc.info.invariant = doc.invariant
+                doc.info.digest(doc.signature)
+                doc.Reference(doc.Catalog)
+                doc.Reference(doc.info)
+                doc.Outlines.prepare(doc, canv)
+                if doc.Outlines.ready < 0:
+                    doc.Catalog.Outlines = None
+                # Objects may register more objects while they are formatted
+                names = []
+                while len(names) + 1 in doc.numberToId:
+                    name = doc.numberToId[len(names) + 1]
+                    if doc.idToObject[name] is not None:
+                        self._write_object(name, doc.idToObject[name])
+                    names.append(name)
+                xref = pdfdoc.PDFCrossReferenceTable()
+                xref.addsection(0, names)
+                xref_offset = pdf_file.add(xref.format(doc))
+                trailer = pdfdoc.PDFTrailer(startxref=xref_offset, Size=len(names) + 1,
+                                            Root=doc.Reference(doc.Catalog), Info=doc.Reference(doc.info),
+                                            Encrypt=None, ID=doc.ID())
+                pdf_file.add(trailer.format(doc))
+            except BaseException:
+                self._discard_output()
+                raise
+            self._pdf_file = None
+            if self._temp_path:
+                self._output.close()
+                os.replace(self._temp_path, self.filename)
+
+        def _start_output(self) -> None:
+            """Open the output and write the PDF header, so pages can follow as they are finished"""
+            if isinstance(self.filename, str):
+                # Written beside the output and moved over it once complete, so a failed build leaves it alone
+                self._temp_path = f"{self.filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+                self._output = open(self._temp_path, 'wb')
+            else:
+                self._temp_path = None
+                self._output = self.filename
+            pdf_file = pdfdoc.PDFFile(self.canv._doc._pdfVersion)
+            self._output.write(b''.join(pdf_file.strings))
+            # Offsets still count from the start of the header
+            pdf_file.write = self._output.write
+            self._pdf_file = pdf_file
+
+        def _discard_output(self) -> None:
+            """Drop a partly written output file"""
+            if self._pdf_file is not None and self._temp_path:
+                self._output.close()
+                os.remove(self._temp_path)
+            self._pdf_file = None
+
+        def _write_object(self, name: str, obj: Any) -> None:
+            """Write one indirect object to the output and release it, keeping only its offset"""
+            doc = self.canv._doc
+            if not rl_config.invariant and rl_config.pdfComments:
+                self._pdf_file.add("%% %s: class %s \n" % (ascii(name), obj.__class__.__name__[:50]))
+            doc.idToOffset[name] = self._pdf_file.add(pdfdoc.PDFIndirectObject(name, obj).format(doc))
+            doc.idToObject[name] = None
+
+        def _write_page(self, page_number: int) -> None:
+            """Compress the page just finished and write it, with its content stream, to the output"""
+            pages = self.canv._doc.Pages.pages
+            page = pages[-1]
+            self._compress_page(page)
+            name = page.__InternalName__
+            # Formatting the page registers its content stream
+            self._write_object(name, page)
+            self._write_object(page.Contents.__InternalName__, page.Contents)
+            pages[-1] = pdfdoc.PDFObjectReference(name)
+
+        @staticmethod
+        def _compress_page(page: Any) -> None:
+            """Replace a finished page's content by its encoded stream"""
+            if not page.compression or not page.stream:
+                return
+            # The same filters the page would get when the PDF is saved
+            filters = [pdfdoc.PDFBase85Encode, pdfdoc.PDFZCompress] if rl_config.useA85 else [pdfdoc.PDFZCompress]
+            content = page.stream
+            for stream_filter in reversed(filters):
+                content = stream_filter.encode(content)
+            stream = pdfdoc.PDFStream(content=content)
+            stream.dictionary['Filter'] = pdfdoc.PDFArray([pdfdoc.PDFName(f.pdfname) for f in filters])
+            stream.__Comment__ = "page stream"
+            page.Contents = stream
+            page.stream = None
+
+    class TextBlock(Flowable):
+        """
+        Lines of plain text drawn without paragraph markup parsing.
+
+        Each entry is one logical line, such as a scalar value or a numbered
+        list item. Lines are wrapped to the frame width using cheap string
+        width measurements, and the block splits between lines across pages.
+        """
+
+        def __init__(self, texts: List[str], style: ParagraphStyle, space_after: float = 0):
+            Flowable.__init__(self)
+            self.texts = texts
+            self.style = style
+            self.spaceAfter = space_after
+            self._lines: List[str] = []
+            self._wrap_width = None
+
+        def _wrap_lines(self, width: float) -> List[str]:
+            if width != self._wrap_width:
+                font_name, font_size = self.style.fontName, self.style.fontSize
+                lines = []
+                for text in self.texts:
+                    if stringWidth(text, font_name, font_size) <= width:
+                        lines.append(text)
+                    else:
+                        lines.extend(simpleSplit(text, font_name, font_size, width))
+                self._lines = lines
+                self._wrap_width = width
+            return self._lines
+
+        def wrap(self, availWidth, availHeight):
+            self.width = availWidth
+            self.height = len(self._wrap_lines(availWidth)) * self.style.leading
+            return self.width, self.height
+
+        def split(self, availWidth, availHeight):
+            lines = self._wrap_lines(availWidth)
+            count = int(availHeight // self.style.leading)
+            if count <= 0:
+                return []
+            if count >= len(lines):
+                return [self]
+            return [type(self)(lines[:count], self.style),
+                    type(self)(lines[count:], self.style, self.spaceAfter)]
+
+        def draw(self):
+            text = self.canv.beginText(0, self.height - self.style.fontSize)
+            text.setFont(self.style.fontName, self.style.fontSize, self.style.leading)
+            text.setFillColor(self.style.textColor)
+            for line in self._lines:
+                text.textLine(line)
+            self.canv.drawText(text)
+
 def print_colorful_banner():
     """Print a colorful banner with application info"""
     banner = """
@@ -44,6 +580,11 @@ def print_menu():
 │    • \033[96m--input\033[92m      : Specify JSON input file                   │
 │    • \033[96m--output\033[92m     : Specify PDF output file                   │
 │                                                             │
+│    • \033[96m--batch\033[92m      : Globs/directories to convert in bulk      │
+│    • \033[96m--manifest\033[92m   : File listing inputs for batch mode        │
+│    • \033[96m--output-dir\033[92m : Output directory for batch mode           │
+│    • \033[96m--workers\033[92m    : Worker processes for batch mode           │
+│                                                             │
 │  \033[93m🎨 CUSTOMIZATION OPTIONS:\033[92m                                   │
 │    • \033[96m--title\033[92m      : Custom document title                     │
 │    • \033[96m--author\033[92m     : Document author name                      │
@@ -55,10 +596,17 @@ def print_menu():
 │    • \033[96m--fontsize\033[92m   : Base font size                            │
 │    • \033[96m--spacing\033[92m    : Line spacing multiplier                   │
 │                                                             │
+│    • \033[96m--stream\033[92m     : Incremental parsing for huge files        │
+│    • \033[96m--parallel-sections\033[92m : Render sections on all cores       │
+│    • \033[96m--cache-dir\033[92m  : Reuse PDFs of unchanged inputs            │
+│    • \033[96m--serve\033[92m      : Local HTTP render service                 │
+│                                                             │
 │  \033[93m🔧 UTILITY OPTIONS:\033[92m                                          │
 │    • \033[96m--help\033[92m       : Show this help message                    │
 │    • \033[96m--version\033[92m    : Show version information                  │
 │    • \033[96m--preview\033[92m    : Preview JSON structure                    │
+│    • \033[96m--profile\033[92m    : Per-path statistics as JSON               │
+│    • \033[96m--quiet\033[92m      : Machine-friendly output and exit codes    │
 │                                                             │
 └─────────────────────────────────────────────────────────────┘\033[0m
     """
@@ -82,6 +630,10 @@ def print_examples():
 │    \033[96mpython Json-to-pdf.py --input data.json --output doc.pdf \\\033[94m  │
 │           \033[96m--pagesize letter --color blue --fontsize 12\033[94m         │
 │                                                             │
+│  \033[93mBatch Conversion:\033[94m                                          │
+│    \033[96mpython Json-to-pdf.py --batch "data/*.json" \\\033[94m               │
+│           \033[96m--output-dir pdfs --workers 8\033[94m                        │
+│                                                             │
 │  \033[93mPreview JSON Structure:\033[94m                                    │
 │    \033[96mpython Json-to-pdf.py --input data.json --preview\033[94m             │
 │                                                             │
@@ -89,6 +641,1134 @@ def print_examples():
     """
     print(examples)
 
+def print_error(message: str, quiet: bool = False) -> None:
+    """Report an error in color on stdout, or as plain text on stderr in quiet mode"""
+    if quiet:
+        print(f"json-to-pdf: {message}", file=sys.stderr)
+    else:
+        print(f"\033[91m❌ {message}\033[0m")
+
+def _json_stream_error(msg: str, offset: int) -> json.JSONDecodeError:
+    """Build a JSONDecodeError for a stream position whose text is no longer buffered"""
+    error = json.JSONDecodeError(msg, '', 0)
+    error.pos = offset
+    error.args = (f"{msg}: char {offset}",)
+    return error
+
+def _iter_json_tokens(file_obj: IO[str], chunk_size: int) -> Iterator[Tuple[str, Any, int]]:
+    """Split a JSON text read in chunks into (token, value, offset) triples"""
+    buf = ''
+    pos = 0
+    consumed = 0
+    eof = False
+
+    def refill() -> None:
+        nonlocal buf, pos, consumed, eof
+        # Grow the read size with the pending token so huge strings stay linear
+        chunk = file_obj.read(max(chunk_size, len(buf) - pos))
+        if not chunk:
+            eof = True
+        consumed += pos
+        buf = buf[pos:] + chunk
+        pos = 0
+
+    while True:
+        pos = _JSON_WHITESPACE.match(buf, pos).end()
+        if pos >= len(buf):
+            if eof:
+                return
+            refill()
+            continue
+
+        char = buf[pos]
+        if char in '{}[]:,':
+            yield char, None, consumed + pos
+            pos += 1
+        elif char == '"':
+            try:
+                text, end = scanstring(buf, pos + 1, True)
+            except json.JSONDecodeError as e:
+                if not eof and (e.msg.startswith('Unterminated') or e.pos >= len(buf) - 6):
+                    refill()
+                    continue
+                raise _json_stream_error(e.msg, consumed + e.pos)
+            yield 'string', text, consumed + pos
+            pos = end
+        else:
+            if not eof and (len(buf) - pos < 16 or
+                            _JSON_NUMBER_CHARS.match(buf, pos).end() >= len(buf)):
+                refill()
+                if not eof:
+                    continue
+            for literal, value in _JSON_LITERALS:
+                if buf.startswith(literal, pos):
+                    yield 'value', value, consumed + pos
+                    pos += len(literal)
+                    break
+            else:
+                match = _JSON_NUMBER.match(buf, pos)
+                if not match:
+                    raise _json_stream_error('Expecting value', consumed + pos)
+                integer, fraction, exponent = match.groups()
+                if fraction or exponent:
+                    value = float(integer + (fraction or '') + (exponent or ''))
+                else:
+                    value = int(integer)
+                yield 'value', value, consumed + pos
+                pos = match.end()
+
+def iter_json_events(file_obj: IO[str], chunk_size: int = JSON_STREAM_CHUNK_SIZE) -> Iterator[Tuple[str, Any]]:
+    """
+    Parse a JSON text incrementally and yield (event, value) pairs.
+
+    Events are 'start_map', 'map_key', 'end_map', 'start_array', 'end_array'
+    and 'value'. Only one chunk of the input is held in memory at a time.
+    """
+    stack: List[str] = []
+    state = 'value'
+    offset = 0
+
+    for token, value, offset in _iter_json_tokens(file_obj, chunk_size):
+        if state in ('value', 'value_or_end'):
+            if token == ']' and state == 'value_or_end':
+                stack.pop()
+                yield 'end_array', None
+            elif token == '{':
+                stack.append('map')
+                yield 'start_map', None
+                state = 'key_or_end'
+                continue
+            elif token == '[':
+                stack.append('array')
+                yield 'start_array', None
+                state = 'value_or_end'
+                continue
+            elif token in ('string', 'value'):
+                yield 'value', value
+            else:
+                raise _json_stream_error('Expecting value', offset)
+        elif state in ('key', 'key_or_end'):
+            if token == '}' and state == 'key_or_end':
+                stack.pop()
+                yield 'end_map', None
+            elif token == 'string':
+                yield 'map_key', value
+                state = 'colon'
+                continue
+            else:
+                raise _json_stream_error('Expecting property name enclosed in double quotes', offset)
+        elif state == 'colon':
+            if token != ':':
+                raise _json_stream_error("Expecting ':' delimiter", offset)
+            state = 'value'
+            continue
+        elif state == 'comma_or_end':
+            container = stack[-1]
+            if token == ',':
+                state = 'key' if container == 'map' else 'value'
+                continue
+            if token == '}' and container == 'map':
+                stack.pop()
+                yield 'end_map', None
+            elif token == ']' and container == 'array':
+                stack.pop()
+                yield 'end_array', None
+            else:
+                raise _json_stream_error("Expecting ',' delimiter", offset)
+        else:
+            raise _json_stream_error('Extra data', offset)
+
+        # A complete value was just closed
+        state = 'comma_or_end' if stack else 'done'
+
+    if state != 'done':
+        raise _json_stream_error('Unexpected end of JSON input', offset)
+
+def build_json_value(event: str, value: Any, events: Iterator[Tuple[str, Any]]) -> Any:
+    """Materialize the value starting at (event, value) from an event stream"""
+    if event == 'value':
+        return value
+
+    root: Any = {} if event == 'start_map' else []
+    stack = [root]
+    key = None
+    for event, value in events:
+        if event == 'map_key':
+            key = value
+            continue
+        if event in ('end_map', 'end_array'):
+            stack.pop()
+            if not stack:
+                return root
+            continue
+
+        if event == 'start_map':
+            child: Any = {}
+        elif event == 'start_array':
+            child = []
+        else:
+            child = value
+
+        parent = stack[-1]
+        if isinstance(parent, dict):
+            parent[key] = child
+        else:
+            parent.append(child)
+        if event != 'value':
+            stack.append(child)
+
+    raise _json_stream_error('Unexpected end of JSON input', 0)
+
+def _json_line_error(error: json.JSONDecodeError, line: str, number: int) -> json.JSONDecodeError:
+    """Re-locate an error from parsing one JSON Lines record to its line in the whole input"""
+    # A record cut short is reported just past its last character, not on the next line
+    column = min(error.pos, len(line.rstrip('\r\n'))) + 1
+    located = json.JSONDecodeError(error.msg, line, error.pos)
+    located.lineno = number
+    located.colno = column
+    located.args = (f"{error.msg}: line {number} column {column}",)
+    return located
+
+def iter_json_lines(file_obj: IO[str]) -> Iterator[Any]:
+    """Yield the value on each non-blank line of JSON Lines (NDJSON) text"""
+    for number, line in enumerate(file_obj, 1):
+        if not line.strip():
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise _json_line_error(e, line, number) from None
+
+def load_schema_columns(schema_path: str) -> List[str]:
+    """
+    Read table columns from a schema file.
+
+    The file holds either a JSON array of column names or a JSON Schema
+    object whose "properties" list the columns in order.
+    """
+    try:
+        with open(schema_path, 'r', encoding='utf-8') as file:
+            schema = json.load(file)
+    except FileNotFoundError as e:
+        raise InputNotFoundError(f"Schema file '{schema_path}' not found!") from e
+    except json.JSONDecodeError as e:
+        raise InvalidJsonError(f"Schema file '{schema_path}': {e}") from e
+    if isinstance(schema, dict) and isinstance(schema.get('properties'), dict):
+        schema = list(schema['properties'])
+    if not isinstance(schema, list) or not schema:
+        raise InvalidJsonError(f"Schema file '{schema_path}' must hold a list of column names "
+                               "or an object with \"properties\"")
+    return [str(column) for column in schema]
+
+class JsonPdfError(Exception):
+    """Base class for errors raised while converting JSON to PDF"""
+
+class InputNotFoundError(JsonPdfError):
+    """The JSON input file does not exist"""
+
+class InvalidJsonError(JsonPdfError):
+    """The JSON input could not be parsed"""
+
+class PdfRenderError(JsonPdfError):
+    """reportlab failed to build the PDF"""
+
+# reportlab.lib.colors names, resolved when a renderer is created
+COLOR_SCHEMES = {
+    'blue': {'primary': 'darkblue', 'secondary': 'blue', 'accent': 'lightblue'},
+    'red': {'primary': 'darkred', 'secondary': 'red', 'accent': 'pink'},
+    'green': {'primary': 'darkgreen', 'secondary': 'green', 'accent': 'lightgreen'},
+    'purple': {'primary': 'purple', 'secondary': 'mediumpurple', 'accent': 'lavender'},
+    'orange': {'primary': 'darkorange', 'secondary': 'orange', 'accent': 'peachpuff'}
+}
+
+PdfOutput = Union[str, os.PathLike, BinaryIO]
+
+def peak_rss_bytes() -> Optional[int]:
+    """The process' peak resident set size so far, or None where it is unavailable"""
+    try:
+        import resource
+    except ImportError:
+        # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS and in kilobytes elsewhere
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+class RenderMetrics:
+    """
+    Wall time and peak memory per conversion phase, plus counts of what was rendered.
+
+    Pass an instance to a render call and read it afterwards, or serialize it
+    with to_dict(). Phases are 'parse', 'build_story' (which contains
+    'table_prep'), 'layout' and 'write'; streaming renders parse while the
+    story is built, so their parsing time is part of 'build_story', and
+    incremental renders build the story during layout, so it is part of
+    'layout'. Parallel
+    section renders record 'sections' and 'merge' instead of the story phases.
+    Memory is the process' peak RSS when each phase ended and how much the
+    phase raised it.
+    """
+
+    def __init__(self):
+        self.phases: Dict[str, Dict[str, Any]] = {}
+        self.flowables: Dict[str, int] = {}
+        self.tables = 0
+        self.table_rows = 0
+        self.table_cells = 0
+        self.pages = 0
+        self.output_bytes = 0
+        self.cached = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Time the enclosed block, adding to earlier runs of the same phase"""
+        peak_before = peak_rss_bytes()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            peak = peak_rss_bytes()
+            stats = self.phases.setdefault(name, {'seconds': 0.0, 'calls': 0,
+                                                  'peak_rss_mb': None, 'peak_rss_growth_mb': None})
+            stats['seconds'] += elapsed
+            stats['calls'] += 1
+            if peak is not None:
+                stats['peak_rss_mb'] = round(peak / (1024 * 1024), 1)
+                stats['peak_rss_growth_mb'] = round(
+                    (stats['peak_rss_growth_mb'] or 0) + (peak - peak_before) / (1024 * 1024), 1)
+
+    def count_flowables(self, flowables: Iterable[Any]) -> Iterator[Any]:
+        """Pass flowables through, counting them by class name"""
+        for flowable in flowables:
+            name = type(flowable).__name__
+            self.flowables[name] = self.flowables.get(name, 0) + 1
+            yield flowable
+
+    def count_table(self, rows: int, columns: int) -> None:
+        """Record a table of `rows` data rows"""
+        self.tables += 1
+        self.count_table_rows(rows, columns)
+
+    def count_table_rows(self, rows: int, columns: int) -> None:
+        """Record rows added to a table that is still being read"""
+        self.table_rows += rows
+        self.table_cells += rows * columns
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The metrics as JSON-serializable data"""
+        return {
+            'cached': self.cached,
+            'total_seconds': round(sum(stats['seconds'] for name, stats in self.phases.items()
+                                       if name != 'table_prep'), 6),
+            'phases': {name: dict(stats, seconds=round(stats['seconds'], 6))
+                       for name, stats in self.phases.items()},
+            'flowables': dict(sorted(self.flowables.items())),
+            'tables': self.tables,
+            'table_rows': self.table_rows,
+            'table_cells': self.table_cells,
+            'pages': self.pages,
+            'output_bytes': self.output_bytes,
+        }
+
+class JsonPdfRenderer:
+    """
+    Reusable JSON to PDF converter for long-running services.
+
+    Page setup, colors and paragraph styles are resolved once when the
+    renderer is created. Each render call builds its own story and document,
+    so a single renderer can be shared between threads. Failures are raised
+    as JsonPdfError subclasses instead of being printed.
+
+    Every render method writes to `output` (a path or a binary file object)
+    and returns None, or returns the PDF bytes when `output` is omitted.
+    """
+
+    def __init__(self, title: str = "Documentation",
+                 author: str = "Generated by JSON-to-PDF",
+                 pagesize: str = "A4",
+                 primary_color: str = "blue",
+                 margins: int = 72,
+                 font_size: int = 12,
+                 spacing: float = 1.0,
+                 streaming: bool = False,
+                 large_table_rows: int = LARGE_TABLE_ROWS,
+                 section_workers: int = 0,
+                 plain_text: bool = True,
+                 incremental: bool = False,
+                 input_format: str = 'json',
+                 columns: Optional[List[str]] = None,
+                 lookahead: int = JSONL_LOOKAHEAD_LINES,
+                 collapse_depth: int = 0,
+                 collapse_mode: str = 'table'):
+        """
+        Args:
+            title: Document title
+            author: Document author
+            pagesize: Page size (A4 or letter)
+            primary_color: Primary color theme
+            margins: Page margins in points
+            font_size: Base font size
+            spacing: Line spacing multiplier
+            streaming: Parse file inputs incrementally instead of loading them whole,
+                and lay them out incrementally as they are parsed
+            large_table_rows: Tables with more rows than this are laid out page by
+                page with fixed column widths (0 disables)
+            section_workers: Render top-level sections in this many worker
+                processes and merge them (0 renders serially; needs pypdf)
+            plain_text: Draw scalar values and simple list items as plain text
+                blocks; False parses them as paragraph markup instead
+            incremental: Produce flowables lazily and release each one once it
+                is laid out, and write each page once it is finished, instead of
+                building the whole story first (always on for streamed input)
+            input_format: 'json', or 'jsonl' for JSON Lines read as one table
+            columns: Table columns for JSON Lines input (default: the keys
+                seen in the first `lookahead` records)
+            lookahead: JSON Lines records, or objects of a streamed array, read ahead
+                to choose table columns and widths
+            collapse_depth: Objects nested this many keys deep or deeper, and
+                arrays there that hold arrays or objects (other than tables),
+                are rendered compactly instead of as one heading per key (0 disables)
+            collapse_mode: 'table' renders a collapsed object or array as a key-path
+                table, 'summary' as a capped list of its first values
+        """
+        self.title = title
+        self.author = author
+        self.pagesize = pagesize
+        self.primary_color = primary_color
+        self.margins = margins
+        self.font_size = font_size
+        self.spacing = spacing
+        self.streaming = streaming
+        self.large_table_rows = large_table_rows
+        self.section_workers = section_workers
+        self.plain_text = plain_text
+        self.incremental = incremental
+        self.input_format = input_format
+        self.columns = columns
+        self.lookahead = lookahead
+        self.collapse_depth = collapse_depth
+        self.collapse_mode = collapse_mode
+
+        _import_reportlab()
+
+        # Set page size
+        self.page_format = A4 if pagesize.lower() == "a4" else letter
+        scheme = COLOR_SCHEMES.get(primary_color.lower(), COLOR_SCHEMES['blue'])
+        self.scheme = {role: getattr(colors, name) for role, name in scheme.items()}
+
+        # Get styles
+        styles = getSampleStyleSheet()
+        self.normal_style = styles['Normal']
+
+        # Custom styles with user preferences
+        self.title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=font_size + 12,
+            spaceAfter=30 * spacing,
+            alignment=TA_CENTER,
+            textColor=self.scheme['primary']
+        )
+
+        self.heading_style = ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontSize=font_size + 4,
+            spaceAfter=12 * spacing,
+            spaceBefore=20 * spacing,
+            textColor=self.scheme['primary']
+        )
+
+        self.subheading_style = ParagraphStyle(
+            'CustomSubHeading',
+            parent=styles['Heading3'],
+            fontSize=font_size + 2,
+            spaceAfter=8 * spacing,
+            spaceBefore=12 * spacing,
+            textColor=self.scheme['secondary']
+        )
+
+        # Keys nested deeper than subheadings, drawn as plain bold text
+        self.key_style = ParagraphStyle(
+            'KeyText',
+            parent=styles['Normal'],
+            fontName='Helvetica-Bold'
+        )
+
+        self.table_style = TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), self.scheme['primary']),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTSIZE', (0, 0), (-1, 0), font_size),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+            ('BACKGROUND', (0, 1), (-1, -1), self.scheme['accent']),
+            ('GRID', (0, 0), (-1, -1), 1, colors.black)
+        ])
+
+    @property
+    def options(self) -> Dict[str, Any]:
+        """The options this renderer was created with, as constructor keyword arguments"""
+        return {
+            'title': self.title,
+            'author': self.author,
+            'pagesize': self.pagesize,
+            'primary_color': self.primary_color,
+            'margins': self.margins,
+            'font_size': self.font_size,
+            'spacing': self.spacing,
+            'streaming': self.streaming,
+            'large_table_rows': self.large_table_rows,
+            'section_workers': self.section_workers,
+            'plain_text': self.plain_text,
+            'incremental': self.incremental,
+            'input_format': self.input_format,
+            'columns': self.columns,
+            'lookahead': self.lookahead,
+            'collapse_depth': self.collapse_depth,
+            'collapse_mode': self.collapse_mode,
+        }
+
+    def render_file(self, json_file_path: str, output: Optional[PdfOutput] = None,
+                    metrics: Optional[RenderMetrics] = None) -> Optional[bytes]:
+        """Render a JSON file ('-' reads standard input), streaming it when the renderer was created with streaming=True"""
+        if json_file_path == '-':
+            return self.render_json(io.TextIOWrapper(sys.stdin.buffer, encoding='utf-8'), output, metrics)
+        try:
+            file = open(json_file_path, 'r', encoding='utf-8')
+        except FileNotFoundError as e:
+            raise InputNotFoundError(f"File '{json_file_path}' not found!") from e
+        with file:
+            return self.render_json(file, output, metrics)
+
+    def render_json(self, file_obj: IO[str], output: Optional[PdfOutput] = None,
+                    metrics: Optional[RenderMetrics] = None) -> Optional[bytes]:
+        """Render JSON text read from an open text file object"""
+        if self.input_format == 'jsonl':
+            return self.render_json_lines(file_obj, output, metrics)
+        if not self.streaming:
+            try:
+                with _metrics_phase(metrics, 'parse'):
+                    data = json.load(file_obj)
+            except json.JSONDecodeError as e:
+                raise InvalidJsonError(str(e)) from e
+            except RecursionError as e:
+                raise InvalidJsonError("JSON nests too deeply to load at once; use --stream") from e
+            return self.render_data(data, output, metrics)
+
+        events = iter_json_events(file_obj)
+        if self.section_workers:
+            try:
+                event, value = next(events)
+                if event != 'start_map':
+                    # Nothing to split into sections
+                    data = build_json_value(event, value, events)
+                    for _ in events:
+                        pass
+                    return self._render(lambda builder: builder.process_data(data), output,
+                                        metrics=metrics)
+            except json.JSONDecodeError as e:
+                raise InvalidJsonError(str(e)) from e
+            return self._render_sections(_iter_event_sections(events), output, metrics)
+
+        def build(builder: '_StoryBuilder') -> Iterator[Flowable]:
+            try:
+                for event, value in events:
+                    yield from builder.process_events(event, value, events)
+            except json.JSONDecodeError as e:
+                raise InvalidJsonError(str(e)) from e
+
+        # Tables pull their rows from the event stream as they are laid out
+        return self._render(build, output, metrics=metrics, incremental=True)
+
+    def render_json_lines(self, file_obj: IO[str], output: Optional[PdfOutput] = None,
+                          metrics: Optional[RenderMetrics] = None) -> Optional[bytes]:
+        """
+        Render JSON Lines text as one table with a row per record, reading it only once.
+
+        Columns come from `columns` or the keys of the first `lookahead`
+        records; keys outside them are left out. Rows are formatted and laid
+        out as they are read and the build is incremental, so neither records
+        nor finished pages are held in memory. Lines holding non-object
+        values render as a numbered list instead.
+        """
+        records = iter_json_lines(file_obj)
+        try:
+            with _metrics_phase(metrics, 'parse'):
+                window = list(itertools.islice(records, max(1, self.lookahead)))
+        except json.JSONDecodeError as e:
+            raise InvalidJsonError(str(e)) from e
+        return self._render(lambda builder: builder.table_from_stream(window, records), output,
+                            metrics=metrics, incremental=True)
+
+    def render_data(self, data: Any, output: Optional[PdfOutput] = None,
+                    metrics: Optional[RenderMetrics] = None) -> Optional[bytes]:
+        """Render already-parsed JSON data"""
+        if self.section_workers and isinstance(data, dict):
+            return self._render_sections(iter(data.items()), output, metrics)
+        return self._render(lambda builder: builder.process_data(data), output, metrics=metrics)
+
+    def render_section(self, key: Any, value: Any, include_title: bool = True) -> bytes:
+        """Render a single top-level section, as it appears in the full document, to PDF bytes"""
+        def build(builder: '_StoryBuilder') -> Iterator[Flowable]:
+            yield builder.heading(key, 0)
+            yield from builder.process_data(value, 1)
+
+        return self._render(build, None, include_title)
+
+    def _render_sections(self, sections: Iterator[Tuple[Any, Any]], output: Optional[PdfOutput],
+                         metrics: Optional[RenderMetrics] = None) -> Optional[bytes]:
+        """Render top-level sections in worker processes and merge them in order"""
+        from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+        import pickle
+        pdf_writer = _import_pdf_writer()
+        futures: List[Future] = []
+        try:
+            with _metrics_phase(metrics, 'sections'), \
+                    ProcessPoolExecutor(max_workers=self.section_workers, initializer=_init_render_worker,
+                                        initargs=(self.options,)) as pool:
+                for key, value in sections:
+                    # Bound how many parsed sections wait in the queue at once
+                    pending = [future for future in futures if not future.done()]
+                    if len(pending) >= 2 * self.section_workers:
+                        wait(pending, return_when=FIRST_COMPLETED)
+                    try:
+                        section = pickle.dumps((key, value), pickle.HIGHEST_PROTOCOL)
+                    except RecursionError:
+                        # Pickling recurses per nesting level; a section this deep is rendered here instead
+                        future = Future()
+                        future.set_result(self.render_section(key, value, not futures))
+                    else:
+                        future = pool.submit(_render_section_worker, section, not futures)
+                    futures.append(future)
+                parts = [future.result() for future in futures]
+        except json.JSONDecodeError as e:
+            raise InvalidJsonError(str(e)) from e
+        except JsonPdfError:
+            raise
+        except Exception as e:
+            raise PdfRenderError(str(e)) from e
+
+        if not parts:
+            # An empty object still gets its title block
+            return self._render(lambda builder: [], output, metrics=metrics)
+        with _metrics_phase(metrics, 'merge'):
+            return merge_pdf_parts(pdf_writer, parts, output, self.title, self.author, metrics)
+
+    def _render(self, build: Callable[['_StoryBuilder'], Iterable[Flowable]], output: Optional[PdfOutput],
+                include_title: bool = True, metrics: Optional[RenderMetrics] = None,
+                incremental: Optional[bool] = None) -> Optional[bytes]:
+        """Create the document, lay out the flowables produced by `build` and write the PDF"""
+        target = io.BytesIO() if output is None else output
+        if isinstance(target, os.PathLike):
+            target = os.fspath(target)
+        start_offset = target.tell() if metrics and not isinstance(target, str) else 0
+
+        # Create PDF document
+        doc = IncrementalDocTemplate(target, pagesize=self.page_format,
+                                     rightMargin=self.margins, leftMargin=self.margins,
+                                     topMargin=self.margins, bottomMargin=self.margins//4,
+                                     title=self.title, author=self.author)
+        # Saved below so layout and writing are timed separately
+        doc._doSave = 0
+
+        if incremental is None:
+            incremental = self.incremental
+        builder = _StoryBuilder(self, doc.width, metrics)
+        flowables = itertools.chain(builder.title() if include_title else [], build(builder))
+        if metrics:
+            flowables = metrics.count_flowables(flowables)
+
+        # Build PDF
+        try:
+            if incremental:
+                with _metrics_phase(metrics, 'layout'):
+                    doc.build_incremental(flowables)
+            else:
+                with _metrics_phase(metrics, 'build_story'):
+                    story = list(flowables)
+                with _metrics_phase(metrics, 'layout'):
+                    doc.build(story)
+            with _metrics_phase(metrics, 'write'):
+                doc.write_pdf()
+        except JsonPdfError:
+            raise
+        except json.JSONDecodeError as e:
+            # Input read while it is laid out
+            raise InvalidJsonError(str(e)) from e
+        except Exception as e:
+            raise PdfRenderError(str(e)) from e
+        if metrics:
+            metrics.pages += doc.page
+            metrics.output_bytes += (os.path.getsize(target) if isinstance(target, str)
+                                     else target.tell() - start_offset)
+        return target.getvalue() if output is None else None
+
+def _metrics_phase(metrics: Optional[RenderMetrics], name: str) -> Any:
+    """Time a phase when metrics are being collected"""
+    return metrics.phase(name) if metrics else nullcontext()
+
+def _iter_event_sections(events: Iterator[Tuple[str, Any]]) -> Iterator[Tuple[Any, Any]]:
+    """Yield (key, value) for each top-level entry once the root 'start_map' was consumed"""
+    for event, value in events:
+        if event == 'end_map':
+            break
+        key = value
+        event, value = next(events)
+        yield key, build_json_value(event, value, events)
+    # Let the parser reject trailing data
+    for _ in events:
+        pass
+
+def _import_pdf_writer() -> Any:
+    """Import pypdf's PdfWriter, which is only needed to merge section PDFs"""
+    try:
+        from pypdf import PdfWriter
+    except ImportError as e:
+        raise PdfRenderError("Parallel section rendering requires pypdf (pip install pypdf)") from e
+    return PdfWriter
+
+def merge_pdf_parts(pdf_writer: Any, parts: List[bytes], output: Optional[PdfOutput],
+                    title: str, author: str, metrics: Optional[RenderMetrics] = None) -> Optional[bytes]:
+    """Concatenate PDF documents in order and write the result with the given metadata"""
+    target = io.BytesIO() if output is None else output
+    if isinstance(target, os.PathLike):
+        target = os.fspath(target)
+    start_offset = target.tell() if metrics and not isinstance(target, str) else 0
+    try:
+        writer = pdf_writer()
+        for part in parts:
+            writer.append(io.BytesIO(part))
+        writer.add_metadata({'/Title': title, '/Author': author})
+        writer.write(target)
+    except Exception as e:
+        # pypdf and file system errors alike
+        raise PdfRenderError(f"Could not merge section PDFs: {e}") from e
+    if metrics:
+        metrics.pages += len(writer.pages)
+        metrics.output_bytes += (os.path.getsize(target) if isinstance(target, str)
+                                 else target.tell() - start_offset)
+    return target.getvalue() if output is None else None
+
+class _StoryBuilder:
+    """Per-render state: produces the flowables of one document from JSON data"""
+
+    def __init__(self, renderer: JsonPdfRenderer, avail_width: float,
+                 metrics: Optional[RenderMetrics] = None):
+        self.renderer = renderer
+        self.avail_width = avail_width
+        self.spacing = renderer.spacing
+        self.metrics = metrics
+
+    def title(self) -> List[Flowable]:
+        """The document title block"""
+        renderer = self.renderer
+        return [
+            Paragraph(renderer.title, renderer.title_style),
+            Paragraph(f"<i>Author: {renderer.author}</i>", renderer.normal_style),
+            Spacer(1, 20 * self.spacing),
+        ]
+
+    def heading(self, key: Any, level: int) -> Flowable:
+        """The heading for a dictionary key at the given nesting level"""
+        text = str(key).replace('_', ' ').title()
+        if level == 0:
+            return Paragraph(text, self.renderer.heading_style)
+        elif level == 1:
+            return Paragraph(text, self.renderer.subheading_style)
+        elif self.renderer.plain_text:
+            return TextBlock([plain_text(f"{text}:")], self.renderer.key_style)
+        else:
+            return Paragraph(f"<b>{text}:</b>", self.renderer.normal_style)
+
+    def simple_list(self, items: Iterable[Any]) -> Iterator[Flowable]:
+        """Yield a numbered list of simple items"""
+        style = self.renderer.normal_style
+        if not self.renderer.plain_text:
+            for i, item in enumerate(items, 1):
+                yield Paragraph(f"{i}. {format_value(item)}", style)
+            yield Spacer(1, 10 * self.spacing)
+            return
+
+        # Items are grouped so a long list becomes a few text blocks
+        block: List[str] = []
+        for i, item in enumerate(items, 1):
+            block.append(plain_text(f"{i}. {format_value(item)}"))
+            if len(block) == TEXT_BLOCK_LINES:
+                yield TextBlock(block, style)
+                block = []
+        if block:
+            yield TextBlock(block, style, 10 * self.spacing)
+        else:
+            yield Spacer(1, 10 * self.spacing)
+
+    def scalar(self, value: Any) -> List[Flowable]:
+        """A simple value"""
+        if self.renderer.plain_text:
+            return [TextBlock([plain_text(str(value))], self.renderer.normal_style, 5 * self.spacing)]
+        return [Paragraph(str(value), self.renderer.normal_style), Spacer(1, 5 * self.spacing)]
+
+    def collapses(self, level: int) -> bool:
+        """Whether objects at this nesting level are rendered compactly"""
+        return 0 < self.renderer.collapse_depth <= level
+
+    def collapses_list(self, data_list: List[Any], level: int) -> bool:
+        """Whether an array at this nesting level is rendered compactly: one holding arrays or objects, but not a table"""
+        return (self.collapses(level) and bool(data_list) and not isinstance(data_list[0], dict)
+                and any(isinstance(item, (dict, list)) for item in data_list))
+
+    def process_data(self, data_obj: Any, level: int = 0) -> Iterator[Flowable]:
+        """
+        Process JSON data, yielding its flowables in document order.
+
+        Objects are walked with an explicit stack of item iterators, so any
+        nesting depth works without recursion.
+        """
+        # One (items iterator, level of its keys) entry per object being walked
+        stack: List[Tuple[Iterator[Tuple[Any, Any]], int]] = []
+        while True:
+            if isinstance(data_obj, dict):
+                if data_obj and self.collapses(level):
+                    yield from self.collapsed(data_obj)
+                else:
+                    stack.append((iter(data_obj.items()), level))
+
+            elif isinstance(data_obj, list):
+                if self.collapses_list(data_obj, level):
+                    yield from self.collapsed(data_obj)
+                elif len(data_obj) > 0 and isinstance(data_obj[0], dict):
+                    # Handle list of dictionaries as table
+                    yield from self.table_from_list(data_obj)
+                else:
+                    # Handle simple list
+                    yield from self.simple_list(data_obj)
+            else:
+                # Handle simple values
+                yield from self.scalar(data_obj)
+
+            # Move on to the next key of the innermost unfinished object
+            while stack:
+                items, key_level = stack[-1]
+                entry = next(items, None)
+                if entry is None:
+                    stack.pop()
+                    continue
+                key, data_obj = entry
+                # Create heading based on level
+                yield self.heading(key, key_level)
+                level = key_level + 1
+                break
+            else:
+                return
+
+    def collapsed(self, data_obj: Union[Dict, List]) -> List[Flowable]:
+        """A deep object or array as one key-path table, or as a capped summary"""
+        renderer = self.renderer
+        if renderer.collapse_mode == 'summary':
+            lines: List[str] = []
+            values = deepest = 0
+            for path, value, depth in iter_leaf_paths(data_obj):
+                values += 1
+                deepest = max(deepest, depth)
+                if len(lines) < COLLAPSE_SUMMARY_LINES:
+                    lines.append(plain_text(f"{path}: {format_leaf(value)}"))
+            if values > len(lines):
+                lines.append(f"... and {values - len(lines)} more")
+            summary = f"{values} values, {deepest} levels deep"
+            return [TextBlock([summary] + lines, renderer.normal_style, 10 * self.spacing)]
+
+        table_data: List[Sequence[str]] = [('Key Path', 'Value')]
+        table_data.extend((path, format_leaf(value)) for path, value, _ in iter_leaf_paths(data_obj))
+        return self.table(table_data)
+
+    def table_from_list(self, data_list: List[Dict]) -> List[Flowable]:
+        """A formatted table from a list of dictionaries"""
+        with _metrics_phase(self.metrics, 'table_prep'):
+            items = [item for item in data_list if isinstance(item, dict)]
+
+            # Columns follow the order in which keys first appear
+            headers = list(dict.fromkeys(key for item in items for key in item))
+            table_data: List[Sequence[str]] = [headers]
+            for start in range(0, len(items), TABLE_FORMAT_BATCH_ROWS):
+                table_data.extend(format_table_rows(items[start:start + TABLE_FORMAT_BATCH_ROWS], headers))
+            return self.table(table_data)
+
+    def table(self, table_data: List[Sequence[str]]) -> List[Flowable]:
+        """A styled table built from a header row and data rows"""
+        if len(table_data) <= 1:  # Only create table if we have data
+            return []
+        if self.metrics:
+            self.metrics.count_table(len(table_data) - 1, len(table_data[0]))
+        renderer = self.renderer
+        if renderer.large_table_rows and len(table_data) - 1 > renderer.large_table_rows:
+            col_widths = compute_column_widths(table_data, renderer.font_size, self.avail_width)
+            table = ChunkedTable(table_data, col_widths, renderer.table_style)
+        else:
+            table = Table(table_data)
+            table.setStyle(renderer.table_style)
+        return [table, Spacer(1, 20 * self.spacing)]
+
+    def table_from_stream(self, window: List[Any], records: Iterator[Any],
+                          new_columns: bool = False) -> Iterator[Flowable]:
+        """
+        Yield a table whose rows are formatted from `records` as it is laid out.
+
+        `window` holds the records already read ahead, which choose the
+        columns (unless the renderer has fixed ones) and column widths. Keys
+        outside them are left out, unless `new_columns` is set: then a record
+        with new keys ends the table and starts another one, with the new
+        columns added, from a fresh read-ahead window.
+        """
+        renderer = self.renderer
+        if not window:
+            return
+        if not isinstance(window[0], dict):
+            yield from self.simple_list(itertools.chain(window, records))
+            return
+
+        def rows(window_rows: List[Tuple[str, ...]], headers: List[str],
+                 overflow: List[Dict]) -> Iterator[Tuple[str, ...]]:
+            yield from window_rows
+            window_rows.clear()
+            known = set(headers)
+            while not overflow:
+                batch = list(itertools.islice(records, TABLE_FORMAT_BATCH_ROWS))
+                if not batch:
+                    break
+                batch = [item for item in batch if isinstance(item, dict)]
+                if new_columns:
+                    for index, item in enumerate(batch):
+                        if not known.issuperset(item):
+                            overflow.extend(batch[index:])
+                            del batch[index:]
+                            break
+                if self.metrics:
+                    self.metrics.count_table_rows(len(batch), len(headers))
+                yield from format_table_rows(batch, headers)
+
+        headers: List[str] = []
+        while window:
+            with _metrics_phase(self.metrics, 'table_prep'):
+                items = [item for item in window if isinstance(item, dict)]
+                if renderer.columns:
+                    headers = renderer.columns
+                else:
+                    # Earlier columns keep their place when a later segment adds some
+                    headers = list(dict.fromkeys(itertools.chain(headers, (key for item in items for key in item))))
+                window_rows = format_table_rows(items, headers)
+                col_widths = compute_column_widths([headers] + window_rows, renderer.font_size, self.avail_width)
+            if self.metrics:
+                self.metrics.count_table(len(window_rows), len(headers))
+            # Records with new keys, read while the table was laid out
+            overflow: List[Dict] = []
+            yield StreamingTable(headers, rows(window_rows, headers, overflow), col_widths, renderer.table_style)
+            yield Spacer(1, 20 * self.spacing)
+            # The table has been placed (and its rows drained) before this resumes
+            window = overflow + list(itertools.islice(records, max(1, renderer.lookahead))) if overflow else []
+
+    def iter_array_items(self, events: Iterator[Tuple[str, Any]], event: str, value: Any) -> Iterator[Any]:
+        """Materialize array items one at a time, starting from the first item event"""
+        while event != 'end_array':
+            yield build_json_value(event, value, events)
+            event, value = next(events)
+
+    def process_events(self, event: str, value: Any, events: Iterator[Tuple[str, Any]],
+                       level: int = 0) -> Iterator[Flowable]:
+        """
+        Process one JSON value from an event stream, mirroring process_data.
+
+        Tables read their rows from `events` while they are laid out, so the
+        flowables must go to an incremental build.
+        """
+        # Key levels of the objects still open in the stream
+        open_levels: List[int] = []
+        while True:
+            if event == 'start_map':
+                if self.collapses(level):
+                    data_obj = build_json_value(event, value, events)
+                    if data_obj:
+                        yield from self.collapsed(data_obj)
+                else:
+                    open_levels.append(level)
+
+            elif event == 'start_array':
+                event, value = next(events)
+                if event == 'start_map':
+                    # Handle list of dictionaries as a table that reads its rows while it is laid out
+                    records = self.iter_array_items(events, event, value)
+                    window = list(itertools.islice(records, max(1, self.renderer.lookahead)))
+                    yield from self.table_from_stream(window, records, new_columns=True)
+                elif self.collapses(level):
+                    # Loaded whole, like a collapsed object, to see whether it nests
+                    yield from self.process_data(list(self.iter_array_items(events, event, value)), level)
+                else:
+                    # Handle simple list
+                    yield from self.simple_list(self.iter_array_items(events, event, value))
+            else:
+                # Handle simple values
+                yield from self.scalar(value)
+
+            # Move on to the next key of the innermost open object
+            while open_levels:
+                event, value = next(events)
+                if event == 'end_map':
+                    open_levels.pop()
+                    continue
+                yield self.heading(value, open_levels[-1])
+                level = open_levels[-1] + 1
+                event, value = next(events)
+                break
+            else:
+                return
+
+def renderer_options(options: Dict[str, Any]) -> Dict[str, Any]:
+    """Complete JsonPdfRenderer keyword arguments with their defaults, as `JsonPdfRenderer.options` lists them"""
+    import inspect
+    bound = inspect.signature(JsonPdfRenderer).bind(**options)
+    bound.apply_defaults()
+    return dict(bound.arguments)
+
+class PdfCache:
+    """
+    Content-addressed on-disk cache of rendered PDFs.
+
+    Entries are keyed by a hash of the input bytes, every rendering option and
+    the tool version, so a hit is always safe to reuse. Least recently used
+    entries are evicted once the cache grows past `max_bytes`; recency is
+    tracked through entry modification times so several processes can share
+    one cache directory.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = DEFAULT_CACHE_BYTES, link: bool = False):
+        """
+        Args:
+            directory: Cache directory (created if missing)
+            max_bytes: Size cap for all cached PDFs together
+            link: Hard-link cached PDFs to the output path instead of copying
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.link = link
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def key_for(self, json_file_path: str, options: Dict[str, Any]) -> str:
+        """Hash the input file, the rendering options and the tool version"""
+        digest = hashlib.sha256()
+        digest.update(f"{__version__}\n".encode('utf-8'))
+        digest.update(json.dumps(options, sort_keys=True).encode('utf-8'))
+        with open(json_file_path, 'rb') as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    def fetch(self, key: str, output_path: str) -> bool:
+        """Place the cached PDF for `key` at output_path, returning False on a miss"""
+        entry = self._entry_path(key)
+        try:
+            # Mark as recently used
+            os.utime(entry)
+        except FileNotFoundError:
+            self.misses += 1
+            return False
+
+        if os.path.lexists(output_path):
+            os.remove(output_path)
+        if self.link:
+            try:
+                os.link(entry, output_path)
+            except OSError:
+                # Different filesystem or no hard-link support
+                shutil.copyfile(entry, output_path)
+        else:
+            shutil.copyfile(entry, output_path)
+        self.hits += 1
+        return True
+
+    def store(self, key: str, pdf_path: str) -> None:
+        """Add a rendered PDF to the cache and evict old entries past the size cap"""
+        temp_path = f"{self._entry_path(key)}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            shutil.copyfile(pdf_path, temp_path)
+            os.replace(temp_path, self._entry_path(key))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self.evict()
+
+    def _entries(self) -> List[os.DirEntry]:
+        return [entry for entry in os.scandir(self.directory)
+                if entry.is_file() and entry.name.endswith('.pdf')]
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits in max_bytes"""
+        entries = sorted(self._entries(), key=lambda entry: entry.stat().st_mtime)
+        total = sum(entry.stat().st_size for entry in entries)
+        for entry in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(entry.path)
+            except FileNotFoundError:
+                # Already evicted by another process
+                pass
+            total -= entry.stat().st_size
+
+    def render_file(self, renderer: Union['JsonPdfRenderer', Dict[str, Any]], json_file_path: str,
+                    output_path: str, metrics: Optional[RenderMetrics] = None) -> bool:
+        """
+        Render json_file_path with `renderer`, reusing a cached PDF when possible.
+
+        `renderer` may also be the keyword arguments for one, which is then
+        only created (and reportlab only imported) on a miss.
+
+        Returns:
+            True on a cache hit, False if the PDF was rendered
+        """
+        with _metrics_phase(metrics, 'cache_lookup'):
+            options = renderer_options(renderer) if isinstance(renderer, dict) else renderer.options
+            try:
+                key = self.key_for(json_file_path, options)
+            except FileNotFoundError as e:
+                raise InputNotFoundError(f"File '{json_file_path}' not found!") from e
+            hit = self.fetch(key, output_path)
+        if hit:
+            if metrics:
+                metrics.cached = True
+                metrics.output_bytes = os.path.getsize(output_path)
+            return True
+        # Render next to the output and move it into place: with `link` the
+        # output may be a hard link to another entry, which must not be rewritten
+        if isinstance(renderer, dict):
+            renderer = JsonPdfRenderer(**renderer)
+        temp_path = f"{output_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            renderer.render_file(json_file_path, temp_path, metrics)
+            os.replace(temp_path, output_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        with _metrics_phase(metrics, 'cache_store'):
+            self.store(key, output_path)
+        return False
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters for this process and the current cache size"""
+        entries = self._entries()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(entries),
+            'bytes': sum(entry.stat().st_size for entry in entries),
+        }
+
 def create_pdf_from_json(json_file_path: str, output_pdf_path: str, 
                         title: str = "Documentation", 
                         author: str = "Generated by JSON-to-PDF",
@@ -96,7 +1776,12 @@ def create_pdf_from_json(json_file_path: str, output_pdf_path: str,
                         primary_color: str = "blue",
                         margins: int = 72,
                         font_size: int = 12,
-                        spacing: float = 1.0) -> None:
+                        spacing: float = 1.0,
+                        streaming: bool = False,
+                        large_table_rows: int = LARGE_TABLE_ROWS,
+                        section_workers: int = 0,
+                        cache: Optional[PdfCache] = None,
+                        metrics: Optional[RenderMetrics] = None) -> bool:
     """
     Create a PDF document from JSON data with customizable options.
     
@@ -110,203 +1795,941 @@ def create_pdf_from_json(json_file_path: str, output_pdf_path: str,
         margins: Page margins in points
         font_size: Base font size
         spacing: Line spacing multiplier
+        streaming: Parse the input incrementally instead of loading it whole
+        large_table_rows: Tables with more rows than this are laid out page by
+            page with fixed column widths (0 disables)
+        section_workers: Render top-level sections in this many worker processes
+            and merge them (0 renders serially; needs pypdf)
+        cache: Optional PdfCache to reuse PDFs rendered earlier from the same input
+        metrics: Optional RenderMetrics that receives per-phase timings and counts
+    
+    Returns:
+        True if the PDF was written, False if an error was reported
+    """
+    renderer = JsonPdfRenderer(title=title, author=author, pagesize=pagesize,
+                               primary_color=primary_color, margins=margins,
+                               font_size=font_size, spacing=spacing,
+                               streaming=streaming, large_table_rows=large_table_rows,
+                               section_workers=section_workers)
+    return convert_json_file(renderer, json_file_path, output_pdf_path, cache,
+                             metrics=metrics) == EXIT_OK
+
+def convert_json_file(renderer: Union[JsonPdfRenderer, Dict[str, Any]], json_file_path: str,
+                      output_pdf_path: str, cache: Optional[PdfCache] = None, quiet: bool = False,
+                      metrics: Optional[RenderMetrics] = None) -> int:
+    """
+    Render one JSON file, report the outcome and return a process exit code.
+
+    `renderer` may be the keyword arguments for one, so a cache hit does not
+    need to create it. In quiet mode nothing is printed on success and errors
+    go to stderr.
     """
-    # Read JSON file
     try:
-        with open(json_file_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-    except FileNotFoundError:
-        print(f"\033[91m❌ Error: File '{json_file_path}' not found!\033[0m")
-        return
-    except json.JSONDecodeError as e:
-        print(f"\033[91m❌ Error: Invalid JSON format in '{json_file_path}': {e}\033[0m")
-        return
-    
-    # Set page size
-    page_format = A4 if pagesize.lower() == "a4" else letter
-    
-    # Create PDF document
-    doc = SimpleDocTemplate(output_pdf_path, pagesize=page_format, 
-                          rightMargin=margins, leftMargin=margins, 
-                          topMargin=margins, bottomMargin=margins//4)
-    
-    # Get styles
-    styles = getSampleStyleSheet()
-    
-    # Define color scheme
-    color_schemes = {
-        'blue': {'primary': colors.darkblue, 'secondary': colors.blue, 'accent': colors.lightblue},
-        'red': {'primary': colors.darkred, 'secondary': colors.red, 'accent': colors.pink},
-        'green': {'primary': colors.darkgreen, 'secondary': colors.green, 'accent': colors.lightgreen},
-        'purple': {'primary': colors.purple, 'secondary': colors.mediumpurple, 'accent': colors.lavender},
-        'orange': {'primary': colors.darkorange, 'secondary': colors.orange, 'accent': colors.peachpuff}
-    }
-    
-    scheme = color_schemes.get(primary_color.lower(), color_schemes['blue'])
-    
-    # Custom styles with user preferences
-    title_style = ParagraphStyle(
-        'CustomTitle',
-        parent=styles['Heading1'],
-        fontSize=font_size + 12,
-        spaceAfter=30 * spacing,
-        alignment=TA_CENTER,
-        textColor=scheme['primary']
-    )
-    
-    heading_style = ParagraphStyle(
-        'CustomHeading',
-        parent=styles['Heading2'],
-        fontSize=font_size + 4,
-        spaceAfter=12 * spacing,
-        spaceBefore=20 * spacing,
-        textColor=scheme['primary']
-    )
-    
-    subheading_style = ParagraphStyle(
-        'CustomSubHeading',
-        parent=styles['Heading3'],
-        fontSize=font_size + 2,
-        spaceAfter=8 * spacing,
-        spaceBefore=12 * spacing,
-        textColor=scheme['secondary']
-    )
-    
-    # Story list to hold all content
-    story = []
-    
-    # Add document metadata
-    story.append(Paragraph(title, title_style))
-    story.append(Paragraph(f"<i>Author: {author}</i>", styles['Normal']))
-    story.append(Spacer(1, 20 * spacing))
+        if cache:
+            cached = cache.render_file(renderer, json_file_path, output_pdf_path, metrics)
+        else:
+            if isinstance(renderer, dict):
+                renderer = JsonPdfRenderer(**renderer)
+            renderer.render_file(json_file_path, output_pdf_path, metrics)
+            cached = False
+    except InputNotFoundError as e:
+        print_error(f"Error: {e}", quiet)
+        return EXIT_INPUT_NOT_FOUND
+    except InvalidJsonError as e:
+        print_error(f"Error: Invalid JSON format in '{json_file_path}': {e}", quiet)
+        return EXIT_INVALID_JSON
+    except PdfRenderError as e:
+        print_error(f"Error generating PDF: {e}", quiet)
+        return EXIT_RENDER_FAILED
     
-    # Process JSON data dynamically
-    def process_data(data_obj: Any, level: int = 0) -> None:
-        """Recursively process JSON data and add to story"""
-        if isinstance(data_obj, dict):
-            for key, value in data_obj.items():
-                # Create heading based on level
-                if level == 0:
-                    story.append(Paragraph(str(key).replace('_', ' ').title(), heading_style))
-                elif level == 1:
-                    story.append(Paragraph(str(key).replace('_', ' ').title(), subheading_style))
+    if quiet:
+        return EXIT_OK
+    options = renderer_options(renderer) if isinstance(renderer, dict) else renderer.options
+    print(f"\033[92m✅ PDF generated successfully: {output_pdf_path}\033[0m")
+    if cached:
+        print(f"\033[96m♻️  Reused cached PDF (input and settings unchanged)\033[0m")
+    if cache:
+        stats = cache.stats()
+        print(f"\033[96m♻️  Cache: {stats['hits']} hit(s), {stats['misses']} miss(es), "
+              f"{stats['entries']} entries, {stats['bytes'] / (1024 * 1024):.1f} MB\033[0m")
+    print(f"\033[94mℹ️  Document Info:\033[0m")
+    print(f"   📄 Title: {options['title']}")
+    print(f"   👤 Author: {options['author']}")
+    print(f"   📏 Page Size: {options['pagesize'].upper()}")
+    print(f"   🎨 Color Theme: {options['primary_color'].title()}")
+    return EXIT_OK
+
+class JsonProfiler:
+    """
+    Per-path statistics for a JSON document, collected from its parse events.
+
+    Paths look like `$.tasks[].cost`, with `[]` standing for every item of an
+    array. Memory stays bounded however large the input is: at most
+    `max_paths` paths and `max_keys` distinct keys per object path are
+    tracked; values under further paths are grouped under
+    OVERFLOW_PROFILE_PATH and counted in `overflow_values`.
+    """
+
+    def __init__(self, max_paths: int = MAX_PROFILE_PATHS, max_keys: int = MAX_PROFILE_KEYS):
+        self.max_paths = max_paths
+        self.max_keys = max_keys
+        self.paths: Dict[str, Dict[str, Any]] = {}
+        self.tables: Dict[str, Dict[str, int]] = {}
+        self.overflow_values = 0
+        self.values = 0
+        self.max_depth = 0
+        self.estimated_paragraphs = 0
+
+    def _stats(self, path: str) -> Dict[str, Any]:
+        stats = self.paths.get(path)
+        if stats is None:
+            if len(self.paths) >= self.max_paths:
+                path = OVERFLOW_PROFILE_PATH
+                stats = self.paths.get(path)
+            if stats is None:
+                stats = self.paths[path] = {'count': 0, 'types': {}}
+        return stats
+
+    def _record(self, path: str, type_name: str) -> Dict[str, Any]:
+        stats = self._stats(path)
+        if path not in self.paths:
+            # Grouped under OVERFLOW_PROFILE_PATH
+            self.overflow_values += 1
+        stats['count'] += 1
+        stats['types'][type_name] = stats['types'].get(type_name, 0) + 1
+        return stats
+
+    def _record_scalar(self, path: str, value: Any) -> None:
+        if isinstance(value, bool):
+            self._record(path, 'boolean')
+        elif value is None:
+            self._record(path, 'null')
+        elif isinstance(value, (int, float)):
+            stats = self._record(path, 'integer' if isinstance(value, int) else 'number')
+            if 'min' not in stats or value < stats['min']:
+                stats['min'] = value
+            if 'max' not in stats or value > stats['max']:
+                stats['max'] = value
+        else:
+            stats = self._record(path, 'string')
+            length = len(value)
+            if 'min_length' not in stats or length < stats['min_length']:
+                stats['min_length'] = length
+            if 'max_length' not in stats or length > stats['max_length']:
+                stats['max_length'] = length
+            stats['total_length'] = stats.get('total_length', 0) + length
+
+    def _record_key(self, path: str, key: str) -> None:
+        stats = self._stats(path)
+        keys = stats.setdefault('keys', {})
+        if key in keys:
+            keys[key] += 1
+        elif len(keys) < self.max_keys:
+            keys[key] = 1
+        else:
+            stats['other_keys'] = stats.get('other_keys', 0) + 1
+
+    def _close_array(self, path: str, length: int, is_table: bool) -> None:
+        stats = self._stats(path)
+        if 'min_items' not in stats or length < stats['min_items']:
+            stats['min_items'] = length
+        if 'max_items' not in stats or length > stats['max_items']:
+            stats['max_items'] = length
+        stats['total_items'] = stats.get('total_items', 0) + length
+        if is_table:
+            if path not in self.paths:
+                # Tables follow the same cap as paths
+                path = OVERFLOW_PROFILE_PATH
+            table = self.tables.setdefault(path, {'tables': 0, 'rows': 0, 'max_rows': 0})
+            table['tables'] += 1
+            table['rows'] += length
+            table['max_rows'] = max(table['max_rows'], length)
+
+    def feed(self, events: Iterable[Tuple[str, Any]]) -> None:
+        """Consume parse events, as produced by iter_json_events"""
+        # Frames: [path, is_array, key_or_item_count, is_table, in_table]
+        stack: List[List[Any]] = []
+        for event, value in events:
+            if event == 'map_key':
+                frame = stack[-1]
+                frame[2] = value
+                self._record_key(frame[0], value)
+                if not frame[4]:
+                    self.estimated_paragraphs += 1
+                continue
+            if event in ('end_map', 'end_array'):
+                frame = stack.pop()
+                if frame[1]:
+                    self._close_array(frame[0], frame[2], frame[3])
+                continue
+
+            self.values += 1
+            in_table = False
+            if not stack:
+                path = '$'
+            else:
+                parent = stack[-1]
+                if parent[1]:
+                    path = parent[0] + '[]'
+                    parent[2] += 1
+                    if parent[2] == 1:
+                        # process_data renders an array as a table when its first item is an object
+                        parent[3] = event == 'start_map'
+                    in_table = parent[4] or parent[3]
                 else:
-                    story.append(Paragraph(f"<b>{str(key).replace('_', ' ').title()}:</b>", styles['Normal']))
-                
-                process_data(value, level + 1)
-                
-        elif isinstance(data_obj, list):
-            if len(data_obj) > 0 and isinstance(data_obj[0], dict):
-                # Handle list of dictionaries as table
-                create_table_from_list(data_obj, scheme)
+                    path = f"{parent[0]}.{parent[2]}"
+                    in_table = parent[4]
+
+            if event == 'start_map':
+                self._record(path, 'object')
+                stack.append([path, False, None, False, in_table])
+            elif event == 'start_array':
+                self._record(path, 'array')
+                stack.append([path, True, 0, False, in_table])
             else:
-                # Handle simple list
-                for i, item in enumerate(data_obj, 1):
-                    if isinstance(item, (str, int, float)):
-                        story.append(Paragraph(f"{i}. {item}", styles['Normal']))
-                    else:
-                        story.append(Paragraph(f"{i}. {str(item)}", styles['Normal']))
-                story.append(Spacer(1, 10 * spacing))
-        else:
-            # Handle simple values
-            story.append(Paragraph(str(data_obj), styles['Normal']))
-            story.append(Spacer(1, 5 * spacing))
-    
-    def create_table_from_list(data_list: List[Dict], color_scheme: Dict) -> None:
-        """Create a formatted table from a list of dictionaries"""
-        if not data_list:
-            return
-            
-        # Get all unique keys for table headers
-        all_keys = set()
-        for item in data_list:
-            if isinstance(item, dict):
-                all_keys.update(item.keys())
-        
-        headers = list(all_keys)
-        table_data = [headers]
-        
-        # Add data rows
-        for item in data_list:
-            if isinstance(item, dict):
-                row = []
-                for header in headers:
-                    value = item.get(header, '')
-                    if isinstance(value, (int, float)) and 'cost' in header.lower() or 'budget' in header.lower():
-                        row.append(f"${format_currency(value)}" if value else '')
-                    else:
-                        row.append(str(value) if value else '')
-                table_data.append(row)
-        
-        if len(table_data) > 1:  # Only create table if we have data
-            table = Table(table_data)
-            table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), color_scheme['primary']),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), font_size),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), color_scheme['accent']),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black)
-            ]))
-            story.append(table)
-            story.append(Spacer(1, 20 * spacing))
-    
-    # Process the entire JSON data
-    process_data(data)
-    
-    # Build PDF
-    try:
-        doc.build(story)
-        print(f"\033[92m✅ PDF generated successfully: {output_pdf_path}\033[0m")
-        print(f"\033[94mℹ️  Document Info:\033[0m")
-        print(f"   📄 Title: {title}")
-        print(f"   👤 Author: {author}")
-        print(f"   📏 Page Size: {pagesize.upper()}")
-        print(f"   🎨 Color Theme: {primary_color.title()}")
-    except Exception as e:
-        print(f"\033[91m❌ Error generating PDF: {e}\033[0m")
+                self._record_scalar(path, value)
+                if not in_table:
+                    self.estimated_paragraphs += 1
+            self.max_depth = max(self.max_depth, len(stack))
 
-def preview_json_structure(json_file_path: str) -> None:
-    """Preview the structure of a JSON file"""
+    def report(self) -> Dict[str, Any]:
+        """Summarize the statistics, including estimated table sizes"""
+        tables = []
+        for path, table in self.tables.items():
+            items = self.paths.get(path + '[]')
+            # Unknown (None) when the table rows were grouped under OVERFLOW_PROFILE_PATH
+            columns = None if items is None else len(items.get('keys', {}))
+            tables.append({
+                'path': path,
+                'tables': table['tables'],
+                'rows': table['rows'],
+                'max_rows': table['max_rows'],
+                'columns': columns,
+                'cells': None if columns is None else table['rows'] * columns,
+                'estimated_pages': -(-table['rows'] // ESTIMATED_TABLE_ROWS_PER_PAGE),
+            })
+        return {
+            'values': self.values,
+            'max_depth': self.max_depth,
+            'paths': self.paths,
+            'overflow_values': self.overflow_values,
+            'tables': tables,
+            'estimated_paragraphs': self.estimated_paragraphs,
+            'estimated_table_rows': sum(table['rows'] for table in tables),
+            'estimated_table_pages': sum(table['estimated_pages'] for table in tables),
+        }
+
+def profile_json_file(json_file_path: str) -> Dict[str, Any]:
+    """
+    Profile a JSON file in one streaming pass with bounded memory.
+
+    Raises:
+        InputNotFoundError: The file does not exist
+        InvalidJsonError: The file is not valid JSON
+    """
+    profiler = JsonProfiler()
     try:
         with open(json_file_path, 'r', encoding='utf-8') as file:
-            data = json.load(file)
-    except FileNotFoundError:
-        print(f"\033[91m❌ Error: File '{json_file_path}' not found!\033[0m")
-        return
+            profiler.feed(iter_json_events(file))
+    except FileNotFoundError as e:
+        raise InputNotFoundError(f"File '{json_file_path}' not found!") from e
     except json.JSONDecodeError as e:
-        print(f"\033[91m❌ Error: Invalid JSON format: {e}\033[0m")
-        return
-    
+        raise InvalidJsonError(str(e)) from e
+    return profiler.report()
+
+def print_json_profile(json_file_path: str, profile: Dict[str, Any]) -> None:
+    """Print a profile from profile_json_file as a readable structure preview"""
     print(f"\033[96m📋 JSON Structure Preview for: {json_file_path}\033[0m")
     print("\033[94m" + "="*60 + "\033[0m")
-    
-    def analyze_structure(obj: Any, indent: int = 0) -> None:
-        prefix = "  " * indent
-        if isinstance(obj, dict):
-            print(f"{prefix}\033[93m📁 Object ({len(obj)} keys):\033[0m")
-            for key, value in obj.items():
-                print(f"{prefix}  \033[96m🔑 {key}:\033[0m", end=" ")
-                if isinstance(value, dict):
-                    print(f"\033[93mObject ({len(value)} keys)\033[0m")
-                    if indent < 2:  # Limit depth
-                        analyze_structure(value, indent + 2)
-                elif isinstance(value, list):
-                    print(f"\033[92mArray ({len(value)} items)\033[0m")
-                    if value and indent < 2:
-                        print(f"{prefix}    \033[95mSample item type: {type(value[0]).__name__}\033[0m")
-                else:
-                    print(f"\033[94m{type(value).__name__}: {str(value)[:50]}{'...' if len(str(value)) > 50 else ''}\033[0m")
-        elif isinstance(obj, list):
-            print(f"{prefix}\033[92m📋 Array ({len(obj)} items)\033[0m")
-            if obj and indent < 2:
-                print(f"{prefix}  \033[95mSample item:\033[0m")
-                analyze_structure(obj[0], indent + 1)
-    
-    analyze_structure(data)
+
+    for path, stats in profile['paths'].items():
+        types = ", ".join(f"{name} ×{count}" for name, count in stats['types'].items())
+        print(f"\033[96m🔑 {path}\033[0m  \033[93m{types}\033[0m")
+        details = []
+        if 'total_items' in stats:
+            details.append(f"items {stats['min_items']}..{stats['max_items']}")
+        if 'keys' in stats:
+            keys = ", ".join(f"{key}({count})" for key, count in stats['keys'].items())
+            if stats.get('other_keys'):
+                keys += f", +{stats['other_keys']} more"
+            details.append(f"keys: {keys}")
+        if 'min' in stats:
+            details.append(f"range {stats['min']}..{stats['max']}")
+        if 'total_length' in stats:
+            details.append(f"length {stats['min_length']}..{stats['max_length']}")
+        for detail in details:
+            print(f"     \033[95m{detail}\033[0m")
+    if profile['overflow_values']:
+        print(f"\033[93m⚠️  {profile['overflow_values']} values under untracked paths were grouped under {OVERFLOW_PROFILE_PATH}\033[0m")
+
+    print("\033[94m" + "="*60 + "\033[0m")
+    for table in profile['tables']:
+        if table['columns'] is None:
+            print(f"\033[92m📊 Table {table['path']}: {table['rows']} rows "
+                  f"(~{table['estimated_pages']} pages)\033[0m")
+        else:
+            print(f"\033[92m📊 Table {table['path']}: {table['rows']} rows × {table['columns']} columns "
+                  f"= {table['cells']} cells (~{table['estimated_pages']} pages)\033[0m")
+    print(f"\033[94mℹ️  {profile['values']} values, depth {profile['max_depth']}, "
+          f"~{profile['estimated_paragraphs']} paragraphs, "
+          f"~{profile['estimated_table_pages']} table pages\033[0m")
+
+def collect_batch_inputs(sources: List[str], manifest: Optional[str] = None,
+                         extensions: Tuple[str, ...] = ('.json',)) -> List[str]:
+    """
+    Expand batch sources into a de-duplicated list of JSON file paths.
+
+    Args:
+        sources: Glob patterns, JSON file paths or directories (searched recursively)
+        manifest: Optional text file listing one input path per line
+        extensions: File name endings picked up when searching directories
+    """
+    paths: List[str] = []
+    for source in sources:
+        if os.path.isdir(source):
+            for root, dirs, files in os.walk(source):
+                dirs.sort()
+                paths.extend(os.path.join(root, name) for name in sorted(files)
+                             if name.lower().endswith(extensions))
+        else:
+            matches = sorted(glob.glob(source))
+            # Keep unmatched literal paths so they are reported as failures
+            paths.extend(matches or [source])
+
+    if manifest:
+        base_dir = os.path.dirname(os.path.abspath(manifest))
+        with open(manifest, 'r', encoding='utf-8') as file:
+            for line in file:
+                line = line.strip()
+                if line and not line.startswith('#'):
+                    paths.append(line if os.path.isabs(line) else os.path.join(base_dir, line))
+
+    seen = set()
+    unique = []
+    for path in paths:
+        key = os.path.abspath(path)
+        if key not in seen:
+            seen.add(key)
+            unique.append(path)
+    return unique
+
+def batch_output_paths(inputs: List[str], output_dir: Optional[str] = None) -> List[str]:
+    """Choose an output PDF path for each input, avoiding name collisions"""
+    outputs = []
+    used = set()
+    for input_path in inputs:
+        input_name = os.path.splitext(os.path.basename(input_path))[0]
+        directory = output_dir if output_dir else os.path.dirname(input_path)
+        candidate = os.path.join(directory, f"{input_name}_output.pdf")
+        counter = 1
+        while os.path.abspath(candidate) in used:
+            counter += 1
+            candidate = os.path.join(directory, f"{input_name}_output_{counter}.pdf")
+        used.add(os.path.abspath(candidate))
+        outputs.append(candidate)
+    return outputs
+
+BatchResult = Tuple[bool, float, str, bool]
+
+_worker_renderer: Optional['JsonPdfRenderer'] = None
+_worker_cache: Optional['PdfCache'] = None
+
+def _init_render_worker(options: Dict[str, Any], cache: Optional['PdfCache'] = None) -> None:
+    """Create the renderer once per worker process so styles are built only once"""
+    global _worker_renderer, _worker_cache
+    _worker_renderer = JsonPdfRenderer(**options)
+    _worker_cache = cache
+    stringWidth('warm-up', 'Helvetica', TABLE_CELL_FONT_SIZE)
+
+def _render_section_worker(section: bytes, include_title: bool) -> bytes:
+    """Render one top-level section, pickled as (key, value), in a worker process"""
+    import pickle
+    key, value = pickle.loads(section)
+    return _worker_renderer.render_section(key, value, include_title)
+
+def _convert_batch_file(input_path: str, output_path: str) -> BatchResult:
+    """Convert one batch file in a worker, returning (success, seconds, message, cached)"""
+    start = time.perf_counter()
+    cached = False
+    try:
+        if _worker_cache:
+            cached = _worker_cache.render_file(_worker_renderer, input_path, output_path)
+        else:
+            _worker_renderer.render_file(input_path, output_path)
+    except InvalidJsonError as e:
+        return False, time.perf_counter() - start, f"Invalid JSON format: {e}", False
+    except JsonPdfError as e:
+        return False, time.perf_counter() - start, str(e), False
+    except Exception as e:
+        return False, time.perf_counter() - start, f"Unexpected error: {e}", False
+    return True, time.perf_counter() - start, output_path, cached
+
+def run_batch(inputs: List[str], output_dir: Optional[str], options: Dict[str, Any],
+              workers: Optional[int] = None, cache: Optional['PdfCache'] = None,
+              quiet: bool = False) -> int:
+    """
+    Convert many JSON files in a pool of worker processes.
+
+    Each file is converted in isolation, so one bad input does not abort the
+    rest of the batch; if a worker process dies, the files it may have been
+    converting are retried one at a time in their own process, and the rest
+    continue in a fresh pool. A summary with per-file timings is printed at the end,
+    unless `quiet` is set, in which case only failures are reported on stderr.
+
+    Returns:
+        The number of files that failed
+    """
+    from concurrent.futures import ProcessPoolExecutor, Future, wait, FIRST_COMPLETED
+    from concurrent.futures.process import BrokenProcessPool
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    outputs = batch_output_paths(inputs, output_dir)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(inputs)))
+    # Imported once here so forked workers inherit it
+    _import_reportlab()
+
+    if not quiet:
+        print(f"\033[94m🚀 Converting {len(inputs)} files with {workers} worker(s)\033[0m")
+        print("\033[94m" + "-"*60 + "\033[0m")
+
+    def new_pool(max_workers: int) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=max_workers, initializer=_init_render_worker,
+                                   initargs=(options, cache))
+
+    def report(input_path: str, result: BatchResult) -> None:
+        results[input_path] = result
+        success, elapsed, message, cached = result
+        if not success:
+            print_error(f"{input_path}: {message}", quiet)
+        elif not quiet:
+            note = ", cached" if cached else ""
+            print(f"\033[92m✅ {input_path} -> {message} ({elapsed:.2f}s{note})\033[0m")
+
+    def run_isolated(input_path: str, output_path: str) -> BatchResult:
+        """Convert one file in a pool of its own, so a crash can only be its own"""
+        with new_pool(1) as single:
+            try:
+                return single.submit(_convert_batch_file, input_path, output_path).result()
+            except BrokenProcessPool:
+                return False, 0.0, "Worker process died (e.g. killed for memory)", False
+
+    results: Dict[str, BatchResult] = {}
+    start = time.perf_counter()
+    queue = list(zip(inputs, outputs))
+    queue.reverse()
+    pool = new_pool(workers)
+    try:
+        # At most one file per worker is in flight, so when a worker dies
+        # only those files are suspects and the rest have not been sent yet
+        running: Dict[Future, Tuple[str, str]] = {}
+        while queue or running:
+            while queue and len(running) < workers:
+                input_path, output_path = queue.pop()
+                running[pool.submit(_convert_batch_file, input_path, output_path)] = (input_path, output_path)
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            suspects = []
+            for future in done:
+                paths = running.pop(future)
+                try:
+                    report(paths[0], future.result())
+                except BrokenProcessPool:
+                    suspects.append(paths)
+                except Exception as e:
+                    report(paths[0], (False, 0.0, f"Worker failed: {e}", False))
+            if suspects:
+                # Every file still in the broken pool fails with it; retry each on its own
+                suspects.extend(running.values())
+                running.clear()
+                pool.shutdown(wait=True)
+                for input_path, output_path in sorted(suspects, key=lambda paths: inputs.index(paths[0])):
+                    report(input_path, run_isolated(input_path, output_path))
+                pool = new_pool(workers)
+    finally:
+        pool.shutdown(wait=True)
+    total_elapsed = time.perf_counter() - start
+
+    if not quiet:
+        print_batch_summary(inputs, results, total_elapsed, cache)
+    return sum(1 for result in results.values() if not result[0])
+
+def print_batch_summary(inputs: List[str], results: Dict[str, BatchResult],
+                        total_elapsed: float, cache: Optional['PdfCache'] = None) -> None:
+    """Print per-file timings, failures and aggregate throughput for a batch"""
+    failures = [path for path in inputs if not results[path][0]]
+    input_bytes = sum(os.path.getsize(path) for path in inputs if os.path.isfile(path))
+
     print("\033[94m" + "="*60 + "\033[0m")
+    print(f"\033[96m📊 Batch Summary\033[0m")
+    for path in inputs:
+        success, elapsed = results[path][:2]
+        status = "\033[92mok\033[0m    " if success else "\033[91mFAILED\033[0m"
+        print(f"   {status} {elapsed:8.2f}s  {path}")
+
+    converted = len(inputs) - len(failures)
+    print(f"\033[94mℹ️  Converted: {converted}/{len(inputs)}  Failed: {len(failures)}\033[0m")
+    hits = sum(1 for result in results.values() if result[3])
+    if cache:
+        # Hits are counted in the workers, so they come from the results
+        stats = cache.stats()
+        print(f"   ♻️  Cache: {hits} hit(s), {converted - hits} rendered, "
+              f"{stats['entries']} entries, {stats['bytes'] / (1024 * 1024):.1f} MB")
+    if total_elapsed > 0:
+        print(f"   ⏱️  Wall time: {total_elapsed:.2f}s  "
+              f"({len(inputs) / total_elapsed:.2f} files/s, "
+              f"{input_bytes / total_elapsed / (1024 * 1024):.2f} MB/s)")
+    for path in failures:
+        print(f"\033[91m   ❌ {path}: {results[path][2]}\033[0m")
+
+class SectionCache:
+    """
+    Rendered PDFs of a document's top-level sections, reused while they are unchanged.
+
+    Sections are keyed by a hash of their key, value and whether they open
+    the document (the first one carries the title block). A rebuild renders
+    only sections whose hash is new and merges all parts with pypdf, so each
+    top-level section starts on a new page, as with --parallel-sections.
+    With a streaming renderer the input is parsed one section at a time.
+    Without pypdf, or for input that has no top-level object, every rebuild
+    renders the whole document; sections too deeply nested to hash are
+    rendered on every rebuild.
+    """
+
+    def __init__(self, renderer: JsonPdfRenderer):
+        self.renderer = renderer
+        self.parts: Dict[str, bytes] = {}
+        try:
+            self.pdf_writer = _import_pdf_writer()
+        except PdfRenderError:
+            self.pdf_writer = None
+
+    @staticmethod
+    def section_hash(key: str, value: Any, first: bool) -> Optional[str]:
+        try:
+            text = json.dumps([first, key, value], ensure_ascii=False, separators=(',', ':'))
+        except RecursionError:
+            return None
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def render_file(self, json_file_path: str, output_path: str) -> Tuple[int, int]:
+        """
+        Render json_file_path to output_path, replacing it atomically.
+
+        Returns:
+            (sections rendered, sections reused)
+        """
+        renderer = self.renderer
+        temp_path = f"{output_path}.{os.getpid()}.tmp"
+        try:
+            if self.pdf_writer is None or renderer.input_format != 'json':
+                renderer.render_file(json_file_path, temp_path)
+                counts = (1, 0)
+            elif renderer.streaming:
+                counts = self._render_stream(json_file_path, temp_path)
+            else:
+                try:
+                    with open(json_file_path, 'r', encoding='utf-8') as file:
+                        data = json.load(file)
+                except FileNotFoundError as e:
+                    raise InputNotFoundError(f"File '{json_file_path}' not found!") from e
+                except json.JSONDecodeError as e:
+                    raise InvalidJsonError(str(e)) from e
+                except RecursionError as e:
+                    raise InvalidJsonError("JSON nests too deeply to load at once; use --stream") from e
+                counts = self.render_data(data, temp_path)
+            os.replace(temp_path, output_path)
+        except OSError as e:
+            raise PdfRenderError(f"Could not write '{output_path}': {e}") from e
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        return counts
+
+    def _render_stream(self, json_file_path: str, output: PdfOutput) -> Tuple[int, int]:
+        """Like render_data, but parsing the file one top-level section at a time"""
+        try:
+            with open(json_file_path, 'r', encoding='utf-8') as file:
+                events = iter_json_events(file)
+                event, value = next(events)
+                if event != 'start_map':
+                    # Nothing to split into sections
+                    self.parts = {}
+                    return self.render_data(build_json_value(event, value, events), output)
+                return self.render_sections(_iter_event_sections(events), output)
+        except FileNotFoundError as e:
+            raise InputNotFoundError(f"File '{json_file_path}' not found!") from e
+        except json.JSONDecodeError as e:
+            raise InvalidJsonError(str(e)) from e
+
+    def render_data(self, data: Any, output: PdfOutput) -> Tuple[int, int]:
+        """Render parsed data section by section, reusing parts from the previous build"""
+        if not isinstance(data, dict) or not data:
+            self.parts = {}
+            self.renderer.render_data(data, output)
+            return 1, 0
+        return self.render_sections(iter(data.items()), output)
+
+    def render_sections(self, sections: Iterator[Tuple[Any, Any]], output: PdfOutput) -> Tuple[int, int]:
+        """Render (key, value) sections in order, reusing parts from the previous build"""
+        renderer = self.renderer
+        parts: Dict[str, bytes] = {}
+        ordered = []
+        rendered = 0
+        for index, (key, value) in enumerate(sections):
+            digest = self.section_hash(key, value, index == 0)
+            part = None if digest is None else parts.get(digest) or self.parts.get(digest)
+            if part is None:
+                part = renderer.render_section(key, value, include_title=index == 0)
+                rendered += 1
+            if digest is not None:
+                parts[digest] = part
+            ordered.append(part)
+        if not ordered:
+            # An empty object still gets its title block
+            self.parts = {}
+            renderer.render_data({}, output)
+            return 1, 0
+        # Only the current sections are kept
+        self.parts = parts
+        merge_pdf_parts(self.pdf_writer, ordered, output, renderer.title, renderer.author)
+        return rendered, len(ordered) - rendered
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def watch_inputs(renderer: JsonPdfRenderer, collect: Callable[[], List[Tuple[str, str]]],
+                 interval: float = WATCH_POLL_SECONDS, debounce: float = WATCH_DEBOUNCE_SECONDS,
+                 quiet: bool = False) -> int:
+    """
+    Rebuild PDFs whenever their inputs change, until interrupted.
+
+    `collect` returns the current (input, output) pairs and is called on every
+    poll, so files added to a watched directory are picked up. A change is
+    rebuilt once the file has stopped changing for `debounce` seconds, and
+    only its changed top-level sections are rendered again.
+    """
+    caches: Dict[str, SectionCache] = {}
+    seen: Dict[str, Optional[Tuple[int, int]]] = {}
+    if not quiet:
+        print(f"\033[94m👀 Watching for changes (Ctrl+C to stop)\033[0m")
+    try:
+        while True:
+            pairs = collect()
+            changed = [(path, output) for path, output in pairs if _file_signature(path) != seen.get(path, False)]
+            if changed:
+                # Wait for editors and exporters to finish writing
+                while True:
+                    snapshot = {path: _file_signature(path) for path, _ in changed}
+                    time.sleep(debounce)
+                    if all(_file_signature(path) == snapshot[path] for path in snapshot):
+                        break
+                for path, output in changed:
+                    seen[path] = snapshot[path]
+                    if snapshot[path] is None:
+                        print_error(f"Error: Input file '{path}' not found!", quiet)
+                        continue
+                    cache = caches.setdefault(path, SectionCache(renderer))
+                    start = time.perf_counter()
+                    try:
+                        rendered, reused = cache.render_file(path, output)
+                    except InvalidJsonError as e:
+                        print_error(f"Error: Invalid JSON format in '{path}': {e}", quiet)
+                        continue
+                    except JsonPdfError as e:
+                        print_error(f"Error: {e}", quiet)
+                        continue
+                    if not quiet:
+                        print(f"\033[92m✅ {path} -> {output} in {time.perf_counter() - start:.2f}s "
+                              f"({rendered} section(s) rendered, {reused} reused)\033[0m")
+
+            # Forget inputs that are no longer collected
+            current = {path for path, _ in pairs}
+            for path in list(caches):
+                if path not in current:
+                    del caches[path]
+                    del seen[path]
+            time.sleep(interval)
+    except KeyboardInterrupt:
+        if not quiet:
+            print(f"\n\033[94m👋 Stopped watching\033[0m")
+    return EXIT_OK
+
+# Render service
+SERVICE_QUERY_OPTIONS = ('title', 'author', 'pagesize', 'color', 'margins', 'fontsize',
+                         'spacing', 'large-table-rows', 'markup-text', 'jsonl', 'lookahead',
+                         'collapse-depth', 'collapse-mode')
+SERVICE_QUERY_FLAGS = ('markup-text', 'jsonl')
+SERVICE_CHUNK_SIZE = 64 * 1024
+# Extra wait for a worker's own timeout to fire before the request is abandoned
+SERVICE_TIMEOUT_GRACE = 5.0
+# Seconds a client may go silent while sending a request before it is dropped
+SERVICE_SOCKET_TIMEOUT = 30.0
+
+_worker_renderers: Dict[Tuple, 'JsonPdfRenderer'] = {}
+
+def _init_service_worker(options: Dict[str, Any]) -> None:
+    """Create the worker's renderer; Ctrl+C is left to the server process, which shuts the pool down"""
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    _init_render_worker(options)
+
+def _warm_render_worker() -> int:
+    """No-op task that makes the pool start a worker process"""
+    return os.getpid()
+
+def _raise_render_timeout(signum: int, frame: Any) -> None:
+    raise TimeoutError("Render timed out")
+
+def _render_request_worker(options: Dict[str, Any], body: bytes, timeout: float) -> bytes:
+    """Render one service request body in a worker, reusing renderers per option set"""
+    key = tuple(sorted(options.items()))
+    renderer = _worker_renderers.get(key)
+    if renderer is None:
+        if _worker_renderer is not None and _worker_renderer.options == options:
+            renderer = _worker_renderer
+        else:
+            renderer = JsonPdfRenderer(**options)
+        if len(_worker_renderers) >= 16:
+            _worker_renderers.clear()
+        _worker_renderers[key] = renderer
+
+    # Abort the render itself on timeout so the worker is freed for the next request
+    alarm = hasattr(signal, 'setitimer') and timeout > 0
+    if alarm:
+        signal.signal(signal.SIGALRM, _raise_render_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        try:
+            text = body.decode('utf-8')
+        except UnicodeDecodeError as e:
+            raise InvalidJsonError(str(e)) from e
+        return renderer.render_json(io.StringIO(text))
+    except PdfRenderError as e:
+        if isinstance(e.__cause__, TimeoutError):
+            raise e.__cause__
+        raise
+    finally:
+        if alarm:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+
+class RenderService:
+    """
+    JSON to PDF rendering over HTTP, backed by a pool of pre-warmed worker processes.
+
+    Requests beyond the busy workers wait in a bounded queue; once it is full
+    new requests are rejected with 503 instead of piling up. Each render is
+    aborted after `timeout` seconds.
+    """
+
+    def __init__(self, parser: argparse.ArgumentParser, defaults: argparse.Namespace,
+                 workers: int, max_queue: int, timeout: float, max_body_bytes: int):
+        self.parser = parser
+        self.defaults = defaults
+        self.workers = workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.max_body_bytes = max_body_bytes
+        self.started = time.time()
+        self._slots = threading.BoundedSemaphore(workers + max_queue)
+        self._lock = threading.Lock()
+        self.counters = {'requests': 0, 'rendered': 0, 'failed': 0, 'rejected': 0,
+                         'timeouts': 0, 'in_flight': 0}
+        self.render_seconds = 0.0
+        self.max_render_seconds = 0.0
+        self.pool = None
+
+    def start(self) -> None:
+        """Start the worker processes and wait until each has built its renderer"""
+        from concurrent.futures import ProcessPoolExecutor, wait
+        # Imported once here so forked workers inherit it
+        _import_reportlab()
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_init_service_worker,
+                                        initargs=(render_options_from_args(self.defaults),))
+        wait([self.pool.submit(_warm_render_worker) for _ in range(self.workers)])
+
+    def stop(self) -> None:
+        """Cancel queued renders and wait for the running ones to end"""
+        if self.pool:
+            self.pool.shutdown(cancel_futures=True)
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self.counters[name] += amount
+
+    def request_options(self, query: Dict[str, List[str]]) -> Dict[str, Any]:
+        """
+        Renderer options for a request: the server's options overridden by query parameters.
+
+        Parameters use the command-line option names without dashes, e.g.
+        ?title=Report&color=green&markup-text=1, and are validated by the
+        same argument parser.
+        """
+        argv = []
+        for name, values in query.items():
+            if name not in SERVICE_QUERY_OPTIONS:
+                raise ValueError(f"unknown option '{name}'")
+            if name in SERVICE_QUERY_FLAGS:
+                if values[-1].lower() in ('1', 'true', 'yes', 'on'):
+                    argv.append(f'--{name}')
+            else:
+                argv.append(f'--{name}={values[-1]}')
+        try:
+            args = self.parser.parse_args(argv, namespace=argparse.Namespace(**vars(self.defaults)))
+        except argparse.ArgumentError as e:
+            raise ValueError(str(e)) from e
+        return render_options_from_args(args)
+
+    def render(self, query: Dict[str, List[str]], body: bytes) -> Tuple[int, str, bytes]:
+        """Render a request body and return (HTTP status, content type, payload)"""
+        from concurrent.futures import TimeoutError as FutureTimeoutError
+        from concurrent.futures.process import BrokenProcessPool
+        self._count('requests')
+        try:
+            options = self.request_options(query)
+        except ValueError as e:
+            self._count('failed')
+            return _json_response(400, {'error': str(e)})
+
+        if not self._slots.acquire(blocking=False):
+            self._count('rejected')
+            return _json_response(503, {'error': 'Render queue is full, retry later'})
+        self._count('in_flight')
+        start = time.perf_counter()
+        pool = self.pool
+        try:
+            future = pool.submit(_render_request_worker, options, body, self.timeout)
+            pdf = future.result(timeout=self.timeout + SERVICE_TIMEOUT_GRACE if self.timeout else None)
+        except (TimeoutError, FutureTimeoutError):
+            self._count('timeouts')
+            return _json_response(504, {'error': f'Render did not finish within {self.timeout:g}s'})
+        except InvalidJsonError as e:
+            self._count('failed')
+            return _json_response(400, {'error': f'Invalid JSON: {e}'})
+        except BrokenProcessPool:
+            self._count('failed')
+            self._replace_pool(pool)
+            return _json_response(500, {'error': 'Render worker died, the pool was restarted'})
+        except Exception as e:
+            self._count('failed')
+            return _json_response(500, {'error': f'Error generating PDF: {e}'})
+        finally:
+            self._count('in_flight', -1)
+            self._slots.release()
+
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.counters['rendered'] += 1
+            self.render_seconds += elapsed
+            self.max_render_seconds = max(self.max_render_seconds, elapsed)
+        return 200, 'application/pdf', pdf
+
+    def _replace_pool(self, broken: Any) -> None:
+        with self._lock:
+            if self.pool is not broken:
+                # Another request already replaced it
+                return
+            broken.shutdown(wait=False, cancel_futures=True)
+            self.start()
+
+    def health(self) -> Dict[str, Any]:
+        return {'status': 'ok', 'workers': self.workers, 'version': __version__}
+
+    def metrics(self) -> Dict[str, Any]:
+        """Request counters, queue state and render latency"""
+        with self._lock:
+            counters = dict(self.counters)
+            rendered = counters['rendered']
+            return dict(counters,
+                        queued=max(0, counters['in_flight'] - self.workers),
+                        workers=self.workers,
+                        queue_limit=self.max_queue,
+                        uptime_seconds=round(time.time() - self.started, 1),
+                        mean_render_seconds=round(self.render_seconds / rendered, 4) if rendered else None,
+                        max_render_seconds=round(self.max_render_seconds, 4))
+
+def _json_response(status: int, data: Dict[str, Any]) -> Tuple[int, str, bytes]:
+    return status, 'application/json', json.dumps(data).encode('utf-8')
+
+def run_service(service: RenderService, host: str, port: int, quiet: bool = False) -> int:
+    """Serve POST /render, GET /health and GET /metrics until interrupted"""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from urllib.parse import urlsplit, parse_qs
+
+    class RenderRequestHandler(BaseHTTPRequestHandler):
+        server_version = f"json-to-pdf/{__version__}"
+        # Applied to the connection socket, so a stalled client cannot hold a thread forever
+        timeout = SERVICE_SOCKET_TIMEOUT
+
+        def send_payload(self, status: int, content_type: str, payload: bytes) -> None:
+            self.send_response(status)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            view = memoryview(payload)
+            for start in range(0, len(view), SERVICE_CHUNK_SIZE):
+                self.wfile.write(view[start:start + SERVICE_CHUNK_SIZE])
+
+        def do_GET(self):
+            path = urlsplit(self.path).path
+            if path == '/health':
+                self.send_payload(*_json_response(200, service.health()))
+            elif path == '/metrics':
+                self.send_payload(*_json_response(200, service.metrics()))
+            else:
+                self.send_payload(*_json_response(404, {'error': 'Not found'}))
+
+        def do_POST(self):
+            url = urlsplit(self.path)
+            if url.path != '/render':
+                self.send_payload(*_json_response(404, {'error': 'Not found'}))
+                return
+            length = self.headers.get('Content-Length')
+            if length is None or not length.isdigit():
+                self.send_payload(*_json_response(411, {'error': 'Content-Length is required'}))
+                return
+            if int(length) > service.max_body_bytes:
+                self.close_connection = True
+                self.send_payload(*_json_response(413, {'error': 'Request body is too large'}))
+                return
+            try:
+                body = self.rfile.read(int(length))
+            except TimeoutError:
+                self.close_connection = True
+                self.send_payload(*_json_response(408, {'error': 'Timed out reading the request body'}))
+                return
+            if len(body) < int(length):
+                # The client closed its side before sending the whole body
+                self.close_connection = True
+                self.send_payload(*_json_response(400, {'error': 'Request body is shorter than Content-Length'}))
+                return
+            self.send_payload(*service.render(parse_qs(url.query), body))
+
+        def log_message(self, format, *args):
+            if not quiet:
+                print(f"\033[94m🌐 {self.address_string()} {format % args}\033[0m")
+
+    try:
+        server = ThreadingHTTPServer((host, port), RenderRequestHandler)
+    except OSError as e:
+        print_error(f"Error: Could not listen on {host}:{port}: {e}", quiet)
+        return EXIT_UNEXPECTED_ERROR
+    server.daemon_threads = True
+
+    service.start()
+    if not quiet:
+        print(f"\033[92m✅ Serving on http://{host}:{server.server_address[1]} "
+              f"with {service.workers} worker(s)\033[0m")
+        print(f"\033[94mℹ️  POST /render, GET /health, GET /metrics (Ctrl+C to stop)\033[0m")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.stop()
+    return EXIT_OK
 
 def setup_argument_parser() -> argparse.ArgumentParser:
     """Set up command line argument parser"""
@@ -324,6 +2747,7 @@ This tool automatically processes any JSON structure and creates well-formatted
   \033[96mpython Json-to-pdf.py -i data.json -o report.pdf --title "My Report" --author "John Doe"\033[0m
   \033[96mpython Json-to-pdf.py -i data.json --preview\033[0m
   \033[96mpython Json-to-pdf.py -i data.json -o report.pdf --color red --pagesize letter\033[0m
+  \033[96mpython Json-to-pdf.py --batch "exports/*.json" --output-dir pdfs --workers 8\033[0m
 
 \033[94mFor more information, visit: https://github.com/WangodaFrancis667/Simple-Utilities\033[0m
         """
@@ -331,12 +2755,27 @@ This tool automatically processes any JSON structure and creates well-formatted
     
     # Input/Output arguments
     parser.add_argument('-i', '--input', 
-                       required=True,
-                       help='Path to input JSON file')
+                       help="Path to input JSON file ('-' reads standard input)")
     
     parser.add_argument('-o', '--output',
                        help='Path for output PDF file (default: output.pdf)')
     
+    # Batch arguments
+    parser.add_argument('--batch',
+                       nargs='+',
+                       metavar='SOURCE',
+                       help='Convert many files: glob patterns, JSON files or directories')
+    
+    parser.add_argument('--manifest',
+                       help='Text file listing one input JSON path per line (batch mode)')
+    
+    parser.add_argument('--output-dir',
+                       help='Directory for batch output PDFs (default: next to each input)')
+    
+    parser.add_argument('--workers',
+                       type=int,
+                       help='Number of worker processes for batch mode, --parallel-sections and --serve (default: CPU count)')
+    
     # Customization arguments
     parser.add_argument('--title',
                        default='JSON Document',
@@ -371,21 +2810,200 @@ This tool automatically processes any JSON structure and creates well-formatted
                        default=1.0,
                        help='Line spacing multiplier (default: 1.0)')
     
+    parser.add_argument('--stream',
+                       action='store_true',
+                       help='Parse the JSON incrementally and lay it out as it is read, so tables are not held whole')
+    
+    parser.add_argument('--large-table-rows',
+                       type=int,
+                       default=LARGE_TABLE_ROWS,
+                       help=f'Lay out tables with more rows than this page by page (0 disables, default: {LARGE_TABLE_ROWS})')
+    
+    parser.add_argument('--parallel-sections',
+                       action='store_true',
+                       help='Render top-level sections in parallel worker processes and merge them (requires pypdf)')
+    
+    parser.add_argument('--incremental',
+                       action='store_true',
+                       help='Lay out flowables as they are produced and write finished pages to the output instead of building the whole document first (always on with --stream)')
+    
+    parser.add_argument('--collapse-depth',
+                       type=int,
+                       default=0,
+                       metavar='N',
+                       help='Render objects, and arrays holding arrays or objects, nested N or more keys deep compactly instead of one heading per key (0 disables, default: 0)')
+    
+    parser.add_argument('--collapse-mode',
+                       choices=['table', 'summary'],
+                       default='table',
+                       help=f'How --collapse-depth renders deep objects: a key-path table, or a summary with the first {COLLAPSE_SUMMARY_LINES} values (default: table)')
+    
+    parser.add_argument('--markup-text',
+                       action='store_true',
+                       help='Parse values and list items as paragraph markup instead of drawing plain text (slower)')
+    
+    # JSON Lines arguments
+    parser.add_argument('--jsonl',
+                       action='store_true',
+                       help='Input is JSON Lines / NDJSON, rendered as one table streamed row by row')
+    
+    parser.add_argument('--schema',
+                       metavar='FILE',
+                       help='Table columns for --jsonl: a JSON list of names or a JSON Schema with "properties"')
+    
+    parser.add_argument('--lookahead',
+                       type=int,
+                       default=JSONL_LOOKAHEAD_LINES,
+                       help=f'Records --jsonl, or an array of objects under --stream, reads ahead to choose columns and widths (default: {JSONL_LOOKAHEAD_LINES})')
+    
+    # Cache arguments
+    parser.add_argument('--cache-dir',
+                       help='Reuse PDFs rendered earlier from the same input and settings')
+    
+    parser.add_argument('--cache-size',
+                       type=int,
+                       default=DEFAULT_CACHE_BYTES // (1024 * 1024),
+                       help=f'Cache size cap in MB, least recently used PDFs are evicted first (default: {DEFAULT_CACHE_BYTES // (1024 * 1024)})')
+    
+    parser.add_argument('--cache-link',
+                       action='store_true',
+                       help='Hard-link cached PDFs into place instead of copying them')
+    
+    # Watch arguments
+    parser.add_argument('--watch',
+                       action='store_true',
+                       help='Keep running and rebuild when inputs change, re-rendering only changed top-level sections (requires pypdf)')
+    
+    parser.add_argument('--watch-interval',
+                       type=float,
+                       default=WATCH_POLL_SECONDS,
+                       help=f'Seconds between checks for changed inputs (default: {WATCH_POLL_SECONDS:g})')
+    
+    parser.add_argument('--debounce',
+                       type=float,
+                       default=WATCH_DEBOUNCE_SECONDS,
+                       help=f'Seconds an input must stay unchanged before it is rebuilt (default: {WATCH_DEBOUNCE_SECONDS:g})')
+    
+    # Service arguments
+    parser.add_argument('--serve',
+                       action='store_true',
+                       help='Run a local HTTP render service (POST /render, GET /health, GET /metrics)')
+    
+    parser.add_argument('--host',
+                       default='127.0.0.1',
+                       help='Address for --serve to listen on (default: 127.0.0.1)')
+    
+    parser.add_argument('--port',
+                       type=int,
+                       default=8765,
+                       help='Port for --serve to listen on (default: 8765)')
+    
+    parser.add_argument('--max-queue',
+                       type=int,
+                       default=16,
+                       help='Requests that may wait for a free worker before new ones get 503 (default: 16)')
+    
+    parser.add_argument('--request-timeout',
+                       type=float,
+                       default=60.0,
+                       help='Seconds a render may take before it is aborted with 504 (0 disables, default: 60)')
+    
+    parser.add_argument('--max-body-mb',
+                       type=int,
+                       default=64,
+                       help='Largest accepted request body in MB (default: 64)')
+    
     # Utility arguments
     parser.add_argument('--preview',
                        action='store_true',
                        help='Preview JSON structure without generating PDF')
     
+    parser.add_argument('--profile',
+                       action='store_true',
+                       help='Stream through the JSON and print per-path statistics and table size estimates as JSON')
+    
+    parser.add_argument('--metrics',
+                       metavar='FILE',
+                       help="Write per-phase timings, peak memory and flowable, table and page counts as JSON to FILE ('-' for stdout, which implies --quiet)")
+    
+    parser.add_argument('-q', '--quiet',
+                       action='store_true',
+                       help='No banner, menu or progress output; errors go to stderr and the exit code reports the outcome')
+    
     parser.add_argument('--version',
                        action='version',
-                       version='JSON-to-PDF Converter v2.0')
+                       version=f'JSON-to-PDF Converter v{__version__}')
     
     return parser
 
-def main():
+def render_options_from_args(args: argparse.Namespace) -> Dict[str, Any]:
+    """JsonPdfRenderer keyword arguments for parsed command-line arguments"""
+    return dict(
+        title=args.title,
+        author=args.author,
+        pagesize=args.pagesize,
+        primary_color=args.color,
+        margins=args.margins,
+        font_size=args.fontsize,
+        spacing=args.spacing,
+        streaming=args.stream,
+        large_table_rows=args.large_table_rows,
+        section_workers=(args.workers or os.cpu_count() or 1) if args.parallel_sections else 0,
+        plain_text=not args.markup_text,
+        incremental=args.incremental,
+        input_format='jsonl' if args.jsonl else 'json',
+        columns=args.columns,
+        lookahead=args.lookahead,
+        collapse_depth=args.collapse_depth,
+        collapse_mode=args.collapse_mode
+    )
+
+def write_metrics(path: str, data: Dict[str, Any]) -> None:
+    """Write render metrics as JSON to a file, or to stdout when path is '-'"""
+    text = json.dumps(data, indent=2)
+    if path == '-':
+        print(text)
+        return
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(text + '\n')
+
+def quiet_requested(argv: List[str]) -> bool:
+    """
+    Whether the command line asks for quiet mode, checked before it is parsed.
+
+    --profile and --metrics - print JSON to stdout, so they imply quiet mode.
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg == '--':
+            break
+        if arg.startswith('--'):
+            name, equals, value = arg.partition('=')
+            # argparse also accepts unambiguous prefixes such as --qui or --prof
+            if len(name) >= 3 and '--quiet'.startswith(name):
+                return True
+            if len(name) >= 5 and '--profile'.startswith(name):
+                return True
+            if len(name) >= 4 and '--metrics'.startswith(name):
+                if (value if equals else next(args, None)) == '-':
+                    return True
+        elif arg.startswith('-'):
+            # Grouped short flags, e.g. -qi data.json; -i and -o take the rest as their value
+            for flag in arg[1:]:
+                if flag == 'q':
+                    return True
+                if flag in ('i', 'o'):
+                    break
+    return False
+
+def main() -> int:
     """Main function with enhanced command-line interface"""
+    # Quiet mode is known before parsing so the banner can be skipped
+    quiet = quiet_requested(sys.argv[1:])
+    
     # Show banner
-    print_colorful_banner()
+    if not quiet:
+        print_colorful_banner()
     
     # Set up argument parser
     parser = setup_argument_parser()
@@ -393,50 +3011,134 @@ def main():
     # Parse arguments
     try:
         args = parser.parse_args()
-    except SystemExit:
-        print_menu()
-        print_examples()
-        return
+        if not (args.input or args.batch or args.manifest or args.serve):
+            parser.error("one of the arguments -i/--input, --batch, --manifest or --serve is required")
+        if args.metrics and (args.batch or args.manifest):
+            parser.error("--metrics applies to single-file conversions, not batch mode")
+        if args.collapse_depth < 0:
+            parser.error("--collapse-depth must be 0 or greater")
+        if args.schema and not args.jsonl:
+            parser.error("--schema applies to --jsonl input")
+        if args.watch and (args.input == '-' or args.serve or args.preview or args.profile):
+            parser.error("--watch needs input files and cannot be combined with --serve, --preview or --profile")
+    except SystemExit as e:
+        if not quiet:
+            print_menu()
+            print_examples()
+        return e.code
     
-    # Handle preview mode
-    if args.preview:
-        preview_json_structure(args.input)
-        return
+    try:
+        args.columns = load_schema_columns(args.schema) if args.schema else None
+    except InputNotFoundError as e:
+        print_error(f"Error: {e}", quiet)
+        return EXIT_INPUT_NOT_FOUND
+    except InvalidJsonError as e:
+        print_error(f"Error: {e}", quiet)
+        return EXIT_INVALID_JSON
+    
+    render_options = render_options_from_args(args)
+    
+    # Handle service mode
+    if args.serve:
+        # Each request is rendered whole in one worker
+        parser.exit_on_error = False
+        defaults = argparse.Namespace(**dict(vars(args), stream=False, parallel_sections=False))
+        service = RenderService(parser, defaults, workers=args.workers or os.cpu_count() or 1,
+                                max_queue=args.max_queue, timeout=args.request_timeout,
+                                max_body_bytes=args.max_body_mb * 1024 * 1024)
+        return run_service(service, args.host, args.port, quiet)
+    
+    cache = None
+    # Standard input cannot be hashed without consuming it
+    if args.cache_dir and args.input != '-':
+        cache = PdfCache(args.cache_dir, args.cache_size * 1024 * 1024, link=args.cache_link)
+    
+    # Handle batch mode
+    if args.batch or args.manifest:
+        # Files are already spread over the workers
+        render_options['section_workers'] = 0
+        extensions = ('.jsonl', '.ndjson') if args.jsonl else ('.json',)
+        try:
+            inputs = collect_batch_inputs(args.batch or [], args.manifest, extensions)
+        except OSError as e:
+            print_error(f"Error: Could not read manifest: {e}", quiet)
+            return EXIT_INPUT_NOT_FOUND
+        if args.watch:
+            if args.output_dir:
+                os.makedirs(args.output_dir, exist_ok=True)
+
+            def collect() -> List[Tuple[str, str]]:
+                try:
+                    inputs = collect_batch_inputs(args.batch or [], args.manifest, extensions)
+                except OSError:
+                    return []
+                return list(zip(inputs, batch_output_paths(inputs, args.output_dir)))
+
+            return watch_inputs(JsonPdfRenderer(**render_options), collect,
+                                args.watch_interval, args.debounce, quiet)
+        if not inputs:
+            print_error("Error: No input files matched the batch sources!", quiet)
+            return EXIT_INPUT_NOT_FOUND
+        failures = run_batch(inputs, args.output_dir, render_options, args.workers, cache, quiet)
+        return EXIT_BATCH_FAILURES if failures else EXIT_OK
+    
+    # Handle preview and profile modes
+    if args.preview or args.profile:
+        try:
+            profile = profile_json_file(args.input)
+        except InputNotFoundError as e:
+            print_error(f"Error: {e}", quiet)
+            return EXIT_INPUT_NOT_FOUND
+        except InvalidJsonError as e:
+            print_error(f"Error: Invalid JSON format: {e}", quiet)
+            return EXIT_INVALID_JSON
+        if args.profile:
+            print(json.dumps(profile, indent=2))
+        else:
+            print_json_profile(args.input, profile)
+        return EXIT_OK
     
     # Validate required arguments for PDF generation
     if not args.output:
         # Generate default output filename
-        input_name = os.path.splitext(os.path.basename(args.input))[0]
+        input_name = 'stdin' if args.input == '-' else os.path.splitext(os.path.basename(args.input))[0]
         args.output = f"{input_name}_output.pdf"
-        print(f"\033[93m⚠️  No output file specified. Using: {args.output}\033[0m")
+        if not quiet:
+            print(f"\033[93m⚠️  No output file specified. Using: {args.output}\033[0m")
     
     # Validate input file
-    if not os.path.exists(args.input):
-        print(f"\033[91m❌ Error: Input file '{args.input}' not found!\033[0m")
-        return
+    if args.input != '-' and not os.path.exists(args.input):
+        print_error(f"Error: Input file '{args.input}' not found!", quiet)
+        return EXIT_INPUT_NOT_FOUND
+    
+    # Handle watch mode
+    if args.watch:
+        render_options['section_workers'] = 0
+        return watch_inputs(JsonPdfRenderer(**render_options), lambda: [(args.input, args.output)],
+                            args.watch_interval, args.debounce, quiet)
     
     # Show processing info
-    print(f"\033[94m🚀 Processing JSON file: {args.input}\033[0m")
-    print(f"\033[94m📄 Output PDF: {args.output}\033[0m")
-    print(f"\033[94m🎨 Settings: {args.pagesize} page, {args.color} theme, {args.fontsize}pt font\033[0m")
-    print("\033[94m" + "-"*60 + "\033[0m")
+    if not quiet:
+        print(f"\033[94m🚀 Processing JSON file: {args.input}\033[0m")
+        print(f"\033[94m📄 Output PDF: {args.output}\033[0m")
+        print(f"\033[94m🎨 Settings: {args.pagesize} page, {args.color} theme, {args.fontsize}pt font\033[0m")
+        print("\033[94m" + "-"*60 + "\033[0m")
     
     # Generate PDF
+    metrics = RenderMetrics() if args.metrics else None
     try:
-        create_pdf_from_json(
-            json_file_path=args.input,
-            output_pdf_path=args.output,
-            title=args.title,
-            author=args.author,
-            pagesize=args.pagesize,
-            primary_color=args.color,
-            margins=args.margins,
-            font_size=args.fontsize,
-            spacing=args.spacing
-        )
+        status = convert_json_file(render_options, args.input, args.output, cache, quiet, metrics)
+        if metrics and status == EXIT_OK:
+            data = dict(input=args.input, output=args.output, **metrics.to_dict())
+            if cache:
+                data['cache'] = cache.stats()
+            write_metrics(args.metrics, data)
+        return status
     except Exception as e:
-        print(f"\033[91m❌ Unexpected error: {e}\033[0m")
-        print("\033[93m💡 Try using --preview to check your JSON structure first.\033[0m")
+        print_error(f"Unexpected error: {e}", quiet)
+        if not quiet:
+            print("\033[93m💡 Try using --preview to check your JSON structure first.\033[0m")
+        return EXIT_UNEXPECTED_ERROR
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
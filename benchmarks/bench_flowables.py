@@ -0,0 +1,48 @@
+"""
+Plain text throughput for scalar values and simple lists.
+
+Renders documents made of long scalar lists and many nested scalar fields, once with
+the plain text blocks and once with one markup-parsed Paragraph per value,
+and reports values (flowables in the Paragraph layout) per second.
+
+    python benchmarks/bench_flowables.py --sizes 10000 100000
+"""
+import argparse
+
+from common import Timer, load_converter, quiet
+
+
+def make_documents(size: int) -> dict:
+    """Build the benchmark documents holding `size` values each"""
+    return {
+        'list': {'values': [f'value {i} of the long scalar list' for i in range(size)]},
+        'fields': {'settings': {'group': {f'field_{i}': f'setting {i * 7 % 1000}'
+                                          for i in range(size)}}},
+    }
+
+
+def time_render(converter, data, plain_text: bool) -> float:
+    """Render data to memory and return the elapsed seconds"""
+    renderer = converter.JsonPdfRenderer(plain_text=plain_text)
+    with quiet(), Timer() as timer:
+        renderer.render_data(data)
+    return timer.elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000])
+    args = parser.parse_args()
+
+    converter = load_converter()
+    print(f"{'values':>10}  {'document':<8}  {'mode':<9}  {'seconds':>9}  {'values/sec':>10}")
+    for size in args.sizes:
+        for name, data in make_documents(size).items():
+            for mode, plain_text in (('plain', True), ('paragraph', False)):
+                elapsed = time_render(converter, data, plain_text)
+                print(f"{size:>10}  {name:<8}  {mode:<9}  {elapsed:>9.2f}  {size / elapsed:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
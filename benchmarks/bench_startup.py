@@ -0,0 +1,67 @@
+"""
+Cold-start latency of each Json-to-pdf.py entry path.
+
+Every path is run as a fresh interpreter several times and the min and
+median wall time are reported, so regressions in import cost show up.
+
+    python benchmarks/bench_startup.py --runs 20
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from common import SCRIPT_PATH
+
+
+def time_command(args, runs: int):
+    """Run the converter `runs` times with `args` and return per-run seconds"""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, SCRIPT_PATH] + args,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        json_path = os.path.join(workdir, 'small.json')
+        pdf_path = os.path.join(workdir, 'small.pdf')
+        with open(json_path, 'w', encoding='utf-8') as file:
+            json.dump({'name': 'startup', 'items': [{'id': 1, 'cost': 10}], 'tags': ['a', 'b']}, file)
+
+        paths = [
+            ('interpreter only', None),
+            ('--version', ['--version']),
+            ('--help', ['--help']),
+            ('--preview', ['-i', json_path, '--preview']),
+            ('render (banner)', ['-i', json_path, '-o', pdf_path]),
+            ('render --quiet', ['-q', '-i', json_path, '-o', pdf_path]),
+        ]
+
+        print(f"{'entry path':<18}  {'min ms':>8}  {'median ms':>10}")
+        for name, command in paths:
+            if command is None:
+                timings = []
+                for _ in range(args.runs):
+                    start = time.perf_counter()
+                    subprocess.run([sys.executable, '-c', 'pass'])
+                    timings.append(time.perf_counter() - start)
+            else:
+                timings = time_command(command, args.runs)
+            print(f"{name:<18}  {min(timings) * 1000:>8.1f}  {statistics.median(timings) * 1000:>10.1f}")
+
+
+if __name__ == '__main__':
+    main()
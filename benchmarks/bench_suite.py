@@ -0,0 +1,145 @@
+"""
+End-to-end benchmark suite over synthetic inputs of every shape and size.
+
+Each case is rendered by a fresh `Json-to-pdf.py --metrics` process, so peak
+RSS is per case. Results are compared against a stored baseline and the
+script exits with status 1 when a case is slower, larger in memory or larger
+on disk than the baseline by more than --tolerance.
+
+    python benchmarks/bench_suite.py                    # compare with baseline.json
+    python benchmarks/bench_suite.py --save-baseline    # record a new baseline
+    python benchmarks/bench_suite.py --shapes wide_table --sizes 100000 --render-args="--stream"
+
+Baselines are machine-specific: record one on the machine that compares.
+"""
+import argparse
+import json
+import os
+import platform
+import shlex
+import subprocess
+import sys
+import tempfile
+from typing import Any, Dict, List, Optional
+
+from common import SCRIPT_PATH
+from generators import SHAPES
+
+DEFAULT_SIZES = {
+    'nested': [1000, 4000],
+    'wide_table': [1000, 10000],
+    'scalar_list': [1000, 20000],
+    'mixed': [1000, 10000],
+}
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+# Result fields where a larger value is a regression, and the others where a smaller one is
+HIGHER_IS_WORSE = ('peak_rss_mb', 'output_bytes')
+LOWER_IS_WORSE = ('units_per_sec', 'pages_per_sec')
+
+
+def run_case(workdir: str, shape: str, size: int, render_args: List[str], repeat: int) -> Dict[str, Any]:
+    """Render one generated input and return its fastest run's results"""
+    json_path = os.path.join(workdir, f'{shape}-{size}.json')
+    pdf_path = os.path.join(workdir, f'{shape}-{size}.pdf')
+    with open(json_path, 'w', encoding='utf-8') as file:
+        json.dump(SHAPES[shape](size), file)
+
+    best: Optional[Dict[str, Any]] = None
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, SCRIPT_PATH, '-q', '-i', json_path, '-o', pdf_path, '--metrics', '-']
+            + render_args, capture_output=True, text=True)
+        if completed.returncode != 0:
+            raise RuntimeError(f"{shape}/{size} failed ({completed.returncode}): {completed.stderr.strip()}")
+        metrics = json.loads(completed.stdout)
+        if best is None or metrics['total_seconds'] < best['total_seconds']:
+            best = metrics
+
+    seconds = best['total_seconds']
+    peaks = [stats['peak_rss_mb'] for stats in best['phases'].values() if stats['peak_rss_mb'] is not None]
+    return {
+        'seconds': round(seconds, 4),
+        'units_per_sec': round(size / seconds, 1),
+        'pages': best['pages'],
+        'pages_per_sec': round(best['pages'] / seconds, 1),
+        'peak_rss_mb': max(peaks) if peaks else None,
+        'output_bytes': best['output_bytes'],
+    }
+
+
+def compare(result: Dict[str, Any], baseline: Optional[Dict[str, Any]], tolerance: float) -> List[str]:
+    """Names of the fields that regressed beyond tolerance, marked with their change"""
+    if not baseline:
+        return []
+    regressions = []
+    for field in HIGHER_IS_WORSE + LOWER_IS_WORSE:
+        old, new = baseline.get(field), result.get(field)
+        if not old or new is None:
+            continue
+        change = new / old - 1
+        if (field in HIGHER_IS_WORSE and change > tolerance) or \
+                (field in LOWER_IS_WORSE and change < -tolerance):
+            regressions.append(f'{field} {change:+.0%}')
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--shapes', nargs='+', choices=sorted(SHAPES), default=list(SHAPES))
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        help='Sizes to run for every shape (default: per-shape sizes)')
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='Runs per case, the fastest is kept (default: 1)')
+    parser.add_argument('--render-args', default='',
+                        help='Extra Json-to-pdf.py arguments, e.g. "--stream"')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--save-baseline', action='store_true',
+                        help='Write these results as the new baseline instead of comparing')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Allowed relative change before a case counts as a regression (default: 0.2)')
+    args = parser.parse_args()
+
+    baseline: Dict[str, Any] = {}
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)['results']
+
+    results: Dict[str, Dict[str, Any]] = {}
+    failed = 0
+    print(f"{'case':<20}  {'seconds':>8}  {'units/sec':>10}  {'pages/sec':>9}  "
+          f"{'peak MB':>8}  {'output KB':>9}  vs baseline")
+    with tempfile.TemporaryDirectory() as workdir:
+        for shape in args.shapes:
+            for size in args.sizes or DEFAULT_SIZES[shape]:
+                case = f'{shape}/{size}'
+                result = run_case(workdir, shape, size, shlex.split(args.render_args), args.repeat)
+                results[case] = result
+                if args.save_baseline:
+                    verdict = 'recorded'
+                elif case not in baseline:
+                    verdict = 'no baseline'
+                else:
+                    regressions = compare(result, baseline[case], args.tolerance)
+                    failed += bool(regressions)
+                    speedup = result['units_per_sec'] / baseline[case]['units_per_sec']
+                    verdict = f"REGRESSED: {', '.join(regressions)}" if regressions else f'ok ({speedup:.2f}x)'
+                print(f"{case:<20}  {result['seconds']:>8.2f}  {result['units_per_sec']:>10.0f}  "
+                      f"{result['pages_per_sec']:>9.1f}  {result['peak_rss_mb'] or 0:>8.1f}  "
+                      f"{result['output_bytes'] / 1024:>9.0f}  {verdict}")
+
+    if args.save_baseline:
+        with open(args.baseline, 'w', encoding='utf-8') as file:
+            json.dump({'python': platform.python_version(), 'machine': platform.machine(),
+                       'render_args': args.render_args, 'results': results}, file, indent=2)
+            file.write('\n')
+        print(f"Baseline written to {args.baseline}")
+        return 0
+    if failed:
+        print(f"{failed} case(s) regressed beyond {args.tolerance:.0%}")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
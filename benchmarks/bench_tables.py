@@ -0,0 +1,63 @@
+"""
+Table layout throughput for large list-of-dict arrays.
+
+Renders a single array of records at several sizes and reports rows/sec.
+Use --compare-single to also time the one-big-Table layout (quadratic, so it
+is capped at --single-max rows).
+
+    python benchmarks/bench_tables.py --sizes 10000 100000 1000000
+"""
+import argparse
+import json
+import os
+import tempfile
+
+from common import Timer, load_converter, quiet
+
+
+def write_records(path: str, rows: int) -> None:
+    """Write a JSON document holding one array of `rows` records"""
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write('{"records": [')
+        for i in range(rows):
+            if i:
+                file.write(',')
+            json.dump({'id': i, 'name': f'item-{i}', 'owner': f'team-{i % 17}',
+                       'cost': i * 3 % 10000, 'status': 'open' if i % 3 else 'closed'}, file)
+        file.write(']}')
+
+
+def time_render(converter, json_path: str, pdf_path: str, large_table_rows: int) -> float:
+    """Render json_path and return the elapsed seconds"""
+    with quiet(), Timer() as timer:
+        converter.create_pdf_from_json(json_path, pdf_path, large_table_rows=large_table_rows)
+    return timer.elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[10000, 100000, 1000000])
+    parser.add_argument('--compare-single', action='store_true',
+                        help='Also time the single-Table layout')
+    parser.add_argument('--single-max', type=int, default=10000,
+                        help='Largest size to time with the single-Table layout')
+    args = parser.parse_args()
+
+    converter = load_converter()
+    print(f"{'rows':>10}  {'mode':<8}  {'seconds':>9}  {'rows/sec':>10}")
+    with tempfile.TemporaryDirectory() as workdir:
+        json_path = os.path.join(workdir, 'records.json')
+        pdf_path = os.path.join(workdir, 'records.pdf')
+        for rows in args.sizes:
+            write_records(json_path, rows)
+            modes = [('chunked', 1)]
+            if args.compare_single and rows <= args.single_max:
+                modes.append(('single', 0))
+            for name, large_table_rows in modes:
+                elapsed = time_render(converter, json_path, pdf_path, large_table_rows)
+                print(f"{rows:>10}  {name:<8}  {elapsed:>9.2f}  {rows / elapsed:>10.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""Shared helpers for the Json-to-pdf.py benchmarks"""
+import importlib.util
+import os
+import sys
+import time
+from contextlib import contextmanager, redirect_stdout
+from typing import Iterator
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT_PATH = os.path.join(REPO_ROOT, 'Json-to-pdf.py')
+
+
+def load_converter():
+    """Import Json-to-pdf.py as a module (its file name is not importable directly)"""
+    if 'json_to_pdf' in sys.modules:
+        return sys.modules['json_to_pdf']
+    spec = importlib.util.spec_from_file_location('json_to_pdf', SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    # Registered before executing so worker processes can unpickle its functions
+    sys.modules['json_to_pdf'] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@contextmanager
+def quiet() -> Iterator[None]:
+    """Silence the converter's status output while timing it"""
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        yield
+
+
+class Timer:
+    """Wall-clock timer used as a context manager"""
+
+    def __enter__(self) -> 'Timer':
+        self.start = time.perf_counter()
+        self.elapsed = 0.0
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.elapsed = time.perf_counter() - self.start
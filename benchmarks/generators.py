@@ -0,0 +1,61 @@
+"""
+Synthetic JSON inputs for each shape the converter renders.
+
+Every generator takes a size, the number of units it produces (leaf values,
+table rows or list items), and returns deterministic data so runs compare.
+"""
+from typing import Any, Callable, Dict
+
+STATUSES = ('open', 'closed', 'blocked', 'review')
+
+
+def nested_dicts(size: int, breadth: int = 8) -> Dict[str, Any]:
+    """Dicts nested four levels deep holding `size` scalar leaves"""
+    data: Dict[str, Any] = {}
+    for i in range(size):
+        node = data
+        digits = [i // breadth ** level % breadth for level in (3, 2, 1)]
+        for depth, digit in enumerate(digits):
+            node = node.setdefault(f'level_{depth}_key_{digit}', {})
+        node[f'field_{i % breadth}_{i // breadth}'] = f'value {i}'
+    return data
+
+
+def wide_table(size: int, columns: int = 20) -> Dict[str, Any]:
+    """One list-of-dict table with `size` rows of `columns` mixed-type cells"""
+    records = []
+    for i in range(size):
+        record: Dict[str, Any] = {'id': i, 'name': f'record-{i}', 'status': STATUSES[i % 4],
+                                  'cost': i * 37 % 100000 / 100, 'active': i % 3 == 0}
+        for column in range(len(record), columns):
+            record[f'metric_{column}'] = (i * column) % 997
+        records.append(record)
+    return {'records': records}
+
+
+def scalar_list(size: int) -> Dict[str, Any]:
+    """One simple list of `size` strings"""
+    return {'values': [f'log line {i}: request served in {i % 250} ms' for i in range(size)]}
+
+
+def mixed(size: int) -> Dict[str, Any]:
+    """Sections of scalars, short lists, small tables and nested dicts, about `size` units in total"""
+    data: Dict[str, Any] = {}
+    for section in range(max(1, size // 100)):
+        data[f'section_{section}'] = {
+            'summary': f'Section {section} overview',
+            'owner': f'team-{section % 7}',
+            'tags': [f'tag-{section}-{i}' for i in range(20)],
+            'items': [{'id': i, 'task': f'task {section}.{i}', 'status': STATUSES[i % 4],
+                       'cost': i * 12.5} for i in range(50)],
+            'details': {f'group_{g}': {f'key_{k}': k * g for k in range(5)} for g in range(5)},
+        }
+    return data
+
+
+SHAPES: Dict[str, Callable[[int], Dict[str, Any]]] = {
+    'nested': nested_dicts,
+    'wide_table': wide_table,
+    'scalar_list': scalar_list,
+    'mixed': mixed,
+}
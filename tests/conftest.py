@@ -0,0 +1,21 @@
+"""Shared fixtures for the Json-to-pdf.py tests"""
+import importlib.util
+import os
+import sys
+
+import pytest
+
+SCRIPT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Json-to-pdf.py')
+
+
+@pytest.fixture(scope='session')
+def converter():
+    """Json-to-pdf.py imported as a module (its file name is not importable directly)"""
+    if 'json_to_pdf' in sys.modules:
+        return sys.modules['json_to_pdf']
+    spec = importlib.util.spec_from_file_location('json_to_pdf', SCRIPT_PATH)
+    module = importlib.util.module_from_spec(spec)
+    # Registered before executing so worker processes can unpickle its functions
+    sys.modules['json_to_pdf'] = module
+    spec.loader.exec_module(module)
+    return module
@@ -0,0 +1,55 @@
+"""Tests for batch conversion in Json-to-pdf.py"""
+import json
+import os
+
+import pytest
+
+
+def crash_on_bad(input_path, output_path):
+    """Stand-in for _convert_batch_file whose worker dies on inputs named bad*"""
+    if os.path.basename(input_path).startswith('bad'):
+        os._exit(1)
+    return _real_convert(input_path, output_path)
+
+
+_real_convert = None
+
+
+@pytest.fixture
+def crashing_worker(converter, monkeypatch):
+    # Workers are forked, so they see the patched function
+    global _real_convert
+    _real_convert = converter._convert_batch_file
+    monkeypatch.setattr(converter, '_convert_batch_file', crash_on_bad)
+
+
+def make_inputs(directory, names):
+    paths = []
+    for name in names:
+        path = os.path.join(directory, f"{name}.json")
+        with open(path, 'w') as file:
+            json.dump({'name': name}, file)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize('workers', [1, 3])
+def test_dead_worker_fails_only_its_file(converter, crashing_worker, tmp_path, capsys, workers):
+    inputs = make_inputs(str(tmp_path), ['f1', 'f2', 'bad', 'f3', 'f4', 'f5'])
+    failures = converter.run_batch(inputs, str(tmp_path / 'out'), {}, workers=workers, quiet=True)
+
+    assert failures == 1
+    assert 'bad.json: Worker process died' in capsys.readouterr().err
+    written = sorted(os.listdir(tmp_path / 'out'))
+    assert written == [f'{name}_output.pdf' for name in ('f1', 'f2', 'f3', 'f4', 'f5')]
+
+
+def test_invalid_json_does_not_stop_batch(converter, tmp_path, capsys):
+    inputs = make_inputs(str(tmp_path), ['f1', 'f2'])
+    broken = str(tmp_path / 'broken.json')
+    with open(broken, 'w') as file:
+        file.write('{"a": ')
+    failures = converter.run_batch([inputs[0], broken, inputs[1]], None, {}, workers=2, quiet=True)
+
+    assert failures == 1
+    assert 'broken.json: Invalid JSON format' in capsys.readouterr().err
@@ -0,0 +1,87 @@
+"""Regression tests for PdfCache in Json-to-pdf.py"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+def write_json(path, data):
+    with open(path, 'w') as file:
+        json.dump(data, file)
+
+
+def read_bytes(path):
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+def test_linked_output_does_not_rewrite_cache_entry(converter, tmp_path):
+    renderer = converter.JsonPdfRenderer()
+    cache = converter.PdfCache(str(tmp_path / 'cache'), link=True)
+    source = str(tmp_path / 'data.json')
+    output = str(tmp_path / 'out.pdf')
+
+    write_json(source, {'a': 'FIRST'})
+    assert cache.render_file(renderer, source, output) is False
+    first_key = cache.key_for(source, renderer.options)
+    first_entry = os.path.join(cache.directory, f"{first_key}.pdf")
+    first_pdf = read_bytes(first_entry)
+    # A hit hard-links the output to the entry
+    assert cache.render_file(renderer, source, output) is True
+
+    # A miss must replace the output, not write through the link
+    write_json(source, {'a': 'SECOND'})
+    assert cache.render_file(renderer, source, output) is False
+    assert read_bytes(first_entry) == first_pdf
+
+    write_json(source, {'a': 'FIRST'})
+    assert cache.render_file(renderer, source, output) is True
+    assert read_bytes(output) == first_pdf
+
+
+def test_failed_render_keeps_previous_output(converter, tmp_path):
+    renderer = converter.JsonPdfRenderer()
+    cache = converter.PdfCache(str(tmp_path / 'cache'))
+    source = str(tmp_path / 'data.json')
+    output = str(tmp_path / 'out.pdf')
+
+    write_json(source, {'a': 1})
+    cache.render_file(renderer, source, output)
+    previous = read_bytes(output)
+
+    with open(source, 'w') as file:
+        file.write('{"a": ')
+    with pytest.raises(converter.InvalidJsonError):
+        cache.render_file(renderer, source, output)
+    assert read_bytes(output) == previous
+    assert sorted(os.listdir(tmp_path)) == ['cache', 'data.json', 'out.pdf']
+
+
+def test_options_and_renderer_share_cache_entries(converter, tmp_path):
+    options = {'title': 'Report', 'streaming': True}
+    assert converter.renderer_options(options) == converter.JsonPdfRenderer(**options).options
+
+    cache = converter.PdfCache(str(tmp_path / 'cache'))
+    source = str(tmp_path / 'data.json')
+    write_json(source, {'a': 1})
+    assert cache.render_file(options, source, str(tmp_path / 'first.pdf')) is False
+    renderer = converter.JsonPdfRenderer(**options)
+    assert cache.render_file(renderer, source, str(tmp_path / 'second.pdf')) is True
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+
+def test_cache_hit_does_not_import_reportlab(converter, tmp_path):
+    source = str(tmp_path / 'data.json')
+    write_json(source, {'a': 1})
+    command = [sys.executable, converter.__file__, '-q', '-i', source, '-o', str(tmp_path / 'out.pdf'),
+               '--cache-dir', str(tmp_path / 'cache')]
+    subprocess.run(command, check=True)
+    probe = ("import runpy, sys; sys.argv = %r; "
+             "code = 0\ntry:\n    runpy.run_path(sys.argv[0], run_name='__main__')\n"
+             "except SystemExit as e:\n    code = e.code\n"
+             "print(code, any(name.startswith('reportlab') for name in sys.modules))" % (command[1:],))
+    result = subprocess.run([sys.executable, '-c', probe], capture_output=True, text=True, check=True)
+    assert result.stdout.split() == ['0', 'False']
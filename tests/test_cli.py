@@ -0,0 +1,34 @@
+"""Tests for command-line handling in Json-to-pdf.py"""
+import json
+import subprocess
+import sys
+
+import pytest
+
+
+@pytest.mark.parametrize('argv, quiet', [
+    (['-q', '-i', 'data.json'], True),
+    (['-qi', 'data.json'], True),
+    (['-iq.json'], False),
+    (['--qui', '-i', 'data.json'], True),
+    (['-i', 'data.json', '--profile'], True),
+    (['-i', 'data.json', '--prof'], True),
+    (['-i', 'data.json', '--metrics', '-'], True),
+    (['-i', 'data.json', '--metrics=-'], True),
+    (['-i', 'data.json', '--metr', '-'], True),
+    (['-i', 'data.json', '--metrics', 'metrics.json'], False),
+    (['-i', 'data.json', '--', '-q'], False),
+    (['-i', 'data.json', '-o', 'out.pdf'], False),
+])
+def test_quiet_requested(converter, argv, quiet):
+    assert converter.quiet_requested(argv) is quiet
+
+
+def test_metrics_on_stdout_is_json(converter, tmp_path):
+    source = tmp_path / 'data.json'
+    source.write_text(json.dumps({'a': [1, 2, 3]}))
+    result = subprocess.run([sys.executable, converter.__file__, '-i', str(source), '-o', str(tmp_path / 'out.pdf'),
+                             '--metrics', '-'], capture_output=True, text=True, check=True)
+    metrics = json.loads(result.stdout)
+    assert metrics['pages'] == 1
+    assert 'layout' in metrics['phases']
@@ -0,0 +1,73 @@
+"""Tests for incremental builds that write pages as they are finished in Json-to-pdf.py"""
+import io
+import os
+import re
+
+import pytest
+
+PAGE_OBJECT = re.compile(rb'/Type /Page\b')
+
+
+def read_pdf(data):
+    pypdf = pytest.importorskip('pypdf')
+    return pypdf.PdfReader(io.BytesIO(data), strict=True)
+
+
+def long_story(builder, lines=400, after=None):
+    for index in range(lines):
+        yield from builder.scalar(f"LINE{index}")
+    if after:
+        after()
+    yield from builder.scalar('LASTLINE')
+
+
+def test_finished_pages_are_written_before_the_end(converter):
+    output = io.BytesIO()
+    written = []
+    renderer = converter.JsonPdfRenderer(incremental=True)
+    renderer._render(lambda builder: long_story(
+        builder, after=lambda: written.append(len(PAGE_OBJECT.findall(output.getvalue())))), output)
+
+    assert written[0] >= 2
+    reader = read_pdf(output.getvalue())
+    assert len(reader.pages) > written[0]
+    text = ''.join(page.extract_text() for page in reader.pages)
+    assert 'LINE0' in text and 'LINE399' in text and 'LASTLINE' in text
+    assert reader.metadata.title == renderer.title
+
+
+def test_output_after_existing_bytes(converter):
+    output = io.BytesIO()
+    output.write(b'PREFIX')
+    converter.JsonPdfRenderer(incremental=True)._render(long_story, output)
+    data = output.getvalue()
+    assert data.startswith(b'PREFIX%PDF-')
+    # Cross-reference offsets count from the start of the PDF
+    assert 'LASTLINE' in read_pdf(data[len(b'PREFIX'):]).pages[-1].extract_text()
+
+
+def test_matches_whole_document_build(converter):
+    data = {'rows': [{'id': index, 'name': f"NAME{index}"} for index in range(300)], 'note': 'TAIL'}
+    pages = []
+    for incremental in (False, True):
+        reader = read_pdf(converter.JsonPdfRenderer(incremental=incremental).render_data(data))
+        pages.append([page.extract_text() for page in reader.pages])
+    assert pages[0] == pages[1]
+
+
+def test_failed_build_keeps_previous_output(converter, tmp_path):
+    output = tmp_path / 'out.pdf'
+    output.write_bytes(b'PREVIOUS')
+
+    def fail():
+        raise ValueError('boom')
+
+    renderer = converter.JsonPdfRenderer(incremental=True)
+    with pytest.raises(converter.PdfRenderError, match='boom'):
+        renderer._render(lambda builder: long_story(builder, after=fail), str(output))
+    assert output.read_bytes() == b'PREVIOUS'
+    assert os.listdir(tmp_path) == ['out.pdf']
+
+    renderer._render(long_story, str(output))
+    assert len(read_pdf(output.read_bytes()).pages) > 2
+    assert os.listdir(tmp_path) == ['out.pdf']
@@ -0,0 +1,78 @@
+"""Tests for JSON Lines input and schema columns in Json-to-pdf.py"""
+import io
+import json
+
+import pytest
+
+
+def pdf_text(data):
+    pypdf = pytest.importorskip('pypdf')
+    return ''.join(page.extract_text() for page in pypdf.PdfReader(io.BytesIO(data)).pages)
+
+
+def test_blank_lines_are_skipped(converter):
+    text = '\n{"a": 1}\n   \n\r\n[2]\n"three"'
+    assert list(converter.iter_json_lines(io.StringIO(text))) == [{'a': 1}, [2], 'three']
+
+
+@pytest.mark.parametrize('text, line, column', [
+    ('{"a": 1}\n\n{"a": }\n', 3, 7),
+    ('{"a": 1}\n{"b": 2\n', 2, 8),
+    ('{"a": 1}\r\n{"b": 2\r\n', 2, 8),
+    ('{"a": 1} x\n', 1, 10),
+])
+def test_error_reports_line_and_column_in_whole_input(converter, text, line, column):
+    with pytest.raises(json.JSONDecodeError) as info:
+        list(converter.iter_json_lines(io.StringIO(text)))
+    assert (info.value.lineno, info.value.colno) == (line, column)
+    assert str(info.value).endswith(f"line {line} column {column}")
+    # Reported once, not once per line and again for the whole input
+    assert str(info.value).count('line') == 1
+
+
+def test_render_reports_invalid_line(converter):
+    renderer = converter.JsonPdfRenderer(input_format='jsonl')
+    with pytest.raises(converter.InvalidJsonError, match='line 2 column 1'):
+        renderer.render_json_lines(io.StringIO('{"a": 1}\nnope\n'))
+
+
+@pytest.mark.parametrize('schema, columns', [
+    (['id', 'name', 3], ['id', 'name', '3']),
+    ({'type': 'object', 'properties': {'id': {}, 'name': {}, 'email': {}}}, ['id', 'name', 'email']),
+])
+def test_schema_columns(converter, tmp_path, schema, columns):
+    path = tmp_path / 'schema.json'
+    path.write_text(json.dumps(schema))
+    assert converter.load_schema_columns(str(path)) == columns
+
+
+@pytest.mark.parametrize('schema', [[], {'type': 'object'}, {'properties': ['id']}, 'id'])
+def test_schema_without_columns_is_rejected(converter, tmp_path, schema):
+    path = tmp_path / 'schema.json'
+    path.write_text(json.dumps(schema))
+    with pytest.raises(converter.InvalidJsonError, match='column names'):
+        converter.load_schema_columns(str(path))
+
+
+def test_missing_schema_is_reported(converter, tmp_path):
+    with pytest.raises(converter.InputNotFoundError):
+        converter.load_schema_columns(str(tmp_path / 'missing.json'))
+
+
+def test_keys_after_lookahead_are_left_out(converter):
+    lines = [json.dumps({'id': f"ROW{index}"}) for index in range(6)]
+    lines.append(json.dumps({'id': 'LATEROW', 'late_col': 'LATEVALUE'}))
+    renderer = converter.JsonPdfRenderer(input_format='jsonl', lookahead=3)
+    content = pdf_text(renderer.render_json_lines(io.StringIO('\n'.join(lines))))
+    assert 'ROW0' in content
+    assert 'LATEROW' in content
+    assert 'late_col' not in content
+    assert 'LATEVALUE' not in content
+
+
+def test_schema_columns_override_lookahead(converter):
+    text = '{"id": "ROW1", "name": "NAME1", "secret": "HIDDEN"}\n{"id": "ROW2", "extra": "EXTRA2"}\n'
+    renderer = converter.JsonPdfRenderer(input_format='jsonl', columns=['id', 'extra'])
+    content = pdf_text(renderer.render_json_lines(io.StringIO(text)))
+    assert 'ROW1' in content and 'EXTRA2' in content
+    assert 'HIDDEN' not in content and 'NAME1' not in content
@@ -0,0 +1,73 @@
+"""Tests for rendering deeply nested values in Json-to-pdf.py"""
+import io
+
+import pytest
+
+DEPTH = 3000
+
+
+def nested_list(depth, leaf=1):
+    value = leaf
+    for _ in range(depth):
+        value = [value]
+    return value
+
+
+def deep_document(depth=DEPTH):
+    return '{"a": [%s1%s, 2], "b": [{"x": %s%s}]}' % ('[' * depth, ']' * depth, '[' * depth, ']' * depth)
+
+
+def pdf_text(data):
+    pypdf = pytest.importorskip('pypdf')
+    return ''.join(page.extract_text() for page in pypdf.PdfReader(io.BytesIO(data)).pages)
+
+
+@pytest.mark.parametrize('value', [
+    [1, 'two', None, True, 2.5],
+    {'a': [1, {'b': "it's"}], 'c': {}, 3: []},
+    [[[]], [{}], [{'x': [None]}]],
+])
+def test_format_value_matches_str(converter, value):
+    assert converter.format_value(value) == str(value)
+
+
+def test_format_value_handles_any_depth(converter):
+    assert converter.format_value(nested_list(DEPTH)) == '[' * DEPTH + '1' + ']' * DEPTH
+    value = 'leaf'
+    for _ in range(DEPTH):
+        value = {'k': value}
+    assert converter.format_value(value) == "{'k': " * DEPTH + "'leaf'" + '}' * DEPTH
+
+
+def test_text_column_handles_deep_cells(converter):
+    cells = converter._format_text_column([nested_list(DEPTH), 'plain', None])
+    assert cells == ['[' * DEPTH + '1' + ']' * DEPTH, 'plain', '']
+
+
+@pytest.mark.parametrize('options', [
+    {},
+    {'collapse_depth': 1},
+    {'collapse_depth': 1, 'collapse_mode': 'summary'},
+    {'plain_text': False},
+    {'section_workers': 1},
+])
+def test_streamed_deep_arrays_render(converter, options):
+    renderer = converter.JsonPdfRenderer(streaming=True, **options)
+    assert renderer.render_json(io.StringIO(deep_document())).startswith(b'%PDF')
+
+
+def test_deep_array_is_collapsed(converter):
+    renderer = converter.JsonPdfRenderer(collapse_depth=1)
+    content = pdf_text(renderer.render_data({'a': nested_list(DEPTH, 'DEEPLEAF'), 'flat': ['FLATITEM']}))
+    assert 'Key Path' in content
+    assert 'DEEPLEAF' in content
+    # Arrays that do not nest keep their numbered list
+    assert '1. FLATITEM' in content
+
+
+def test_collapse_keeps_tables_of_objects(converter):
+    renderer = converter.JsonPdfRenderer(collapse_depth=1)
+    builder = converter._StoryBuilder(renderer, 500)
+    assert not builder.collapses_list([{'id': 1}, {'id': [2]}], 1)
+    assert builder.collapses_list([1, [2]], 1)
+    assert not builder.collapses_list([1, [2]], 0)
@@ -0,0 +1,44 @@
+"""Tests for the streaming JSON profiler in Json-to-pdf.py"""
+import io
+import json
+import subprocess
+import sys
+
+
+def profile(converter, data, **limits):
+    profiler = converter.JsonProfiler(**limits)
+    profiler.feed(converter.iter_json_events(io.StringIO(json.dumps(data))))
+    return profiler.report()
+
+
+def test_table_columns_and_rows(converter):
+    report = profile(converter, {'tasks': [{'id': 1, 'cost': 2.5}, {'id': 2, 'owner': 'x'}]})
+    assert report['tables'] == [{
+        'path': '$.tasks', 'tables': 1, 'rows': 2, 'max_rows': 2,
+        'columns': 3, 'cells': 6, 'estimated_pages': 1,
+    }]
+
+
+def test_overflow_counts_values_under_untracked_paths(converter):
+    report = profile(converter, {'a': [{'x': 1, 'y': 2}] * 100}, max_paths=3)
+    assert list(report['paths']) == ['$', '$.a', '$.a[]', converter.OVERFLOW_PROFILE_PATH]
+    assert report['overflow_values'] == 200
+
+
+def test_tables_follow_the_path_cap(converter):
+    data = {f'k{index}': [{'a': index}] for index in range(50)}
+    report = profile(converter, data, max_paths=10)
+    assert len(report['paths']) == 11
+    assert len(report['tables']) <= 11
+    grouped = [table for table in report['tables'] if table['path'] == converter.OVERFLOW_PROFILE_PATH]
+    assert len(grouped) == 1
+    assert grouped[0]['columns'] is None
+    assert sum(table['rows'] for table in report['tables']) == 50
+
+
+def test_profile_output_is_json(converter, tmp_path):
+    source = tmp_path / 'data.json'
+    source.write_text(json.dumps({'a': [1, 2, 3]}))
+    result = subprocess.run([sys.executable, converter.__file__, '-i', str(source), '--profile'],
+                            capture_output=True, text=True, check=True)
+    assert json.loads(result.stdout)['values'] == 5
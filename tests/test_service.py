@@ -0,0 +1,71 @@
+"""Regression tests for the HTTP render service in Json-to-pdf.py"""
+import http.server
+import socket
+import threading
+
+import pytest
+
+
+class StubService:
+    """Stands in for RenderService so no worker processes are started"""
+    workers = 1
+    max_body_bytes = 1024
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def render(self, query, body):
+        return 200, 'application/pdf', b'%PDF-stub'
+
+
+@pytest.fixture
+def server_address(converter, monkeypatch):
+    servers = []
+
+    class RecordingServer(http.server.ThreadingHTTPServer):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            servers.append(self)
+
+    monkeypatch.setattr(http.server, 'ThreadingHTTPServer', RecordingServer)
+    monkeypatch.setattr(converter, 'SERVICE_SOCKET_TIMEOUT', 0.5)
+    thread = threading.Thread(target=converter.run_service,
+                              args=(StubService(), '127.0.0.1', 0, True))
+    thread.start()
+    while not servers:
+        thread.join(0.01)
+    yield servers[0].server_address
+    servers[0].shutdown()
+    thread.join()
+
+
+def post(address, body, length, close_early=False):
+    with socket.create_connection(address, timeout=5) as client:
+        client.sendall(b"POST /render HTTP/1.1\r\nHost: test\r\nConnection: close\r\n"
+                       b"Content-Length: %d\r\n\r\n%s" % (length, body))
+        if close_early:
+            client.shutdown(socket.SHUT_WR)
+        response = b''
+        while chunk := client.recv(4096):
+            response += chunk
+    return int(response.split()[1]), response
+
+
+def test_stalled_body_times_out_with_408(server_address):
+    status, response = post(server_address, b'{"a"', 100)
+    assert status == 408
+    assert b'Timed out' in response
+
+
+def test_truncated_body_is_rejected(server_address):
+    status, response = post(server_address, b'{"a"', 100, close_early=True)
+    assert status == 400
+
+
+def test_complete_body_is_rendered(server_address):
+    status, response = post(server_address, b'{"a": 1}', 8)
+    assert status == 200
+    assert response.endswith(b'%PDF-stub')
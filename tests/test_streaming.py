@@ -0,0 +1,101 @@
+"""Tests for the streaming JSON parser and streamed rendering in Json-to-pdf.py"""
+import io
+import json
+
+import pytest
+
+
+VALID_DOCUMENTS = [
+    '{}',
+    '[]',
+    '0',
+    '-12.5e-3',
+    '"plain"',
+    'true',
+    'null',
+    ' \n{ "a" : [1, 2.0, -3e2, true, false, null], "b": {"c": {}}, "d": [] }\n',
+    '[{"id": 1, "tags": ["x", "y"]}, {"id": 2, "nested": [[[]], [{}]]}]',
+    '"escapes \\" \\\\ \\/ \\b \\f \\n \\r \\t \\u00e9 \\ud83d\\ude00 done"',
+    '{"unicode ключ": "значение", "emoji": "😀", "long": "' + 'x' * 200 + '"}',
+    '[1234567890123456789012, 1E+2, 0.000001, -0]',
+]
+
+INVALID_DOCUMENTS = [
+    '[1, 2,]',
+    '{"a": 1,}',
+    '01',
+    '[01]',
+    '1.',
+    '-',
+    '{"a":',
+    '[1, 2',
+    '"unterminated',
+    'tru',
+    '',
+    '[1] 2',
+    '{"a": 1} {}',
+    '[1 2]',
+    '{"a" 1}',
+    '{1: 2}',
+    '"bad \\x escape"',
+    '"raw \n newline"',
+]
+
+
+def parse_stream(converter, text, chunk_size):
+    events = converter.iter_json_events(io.StringIO(text), chunk_size=chunk_size)
+    event, value = next(events)
+    data = converter.build_json_value(event, value, events)
+    for _ in events:
+        pass
+    return data
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 3, 5, 8, 64])
+@pytest.mark.parametrize('text', VALID_DOCUMENTS)
+def test_stream_parser_matches_json_loads(converter, text, chunk_size):
+    assert parse_stream(converter, text, chunk_size) == json.loads(text)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 3, 64])
+@pytest.mark.parametrize('text', INVALID_DOCUMENTS)
+def test_stream_parser_rejects_what_json_loads_rejects(converter, text, chunk_size):
+    with pytest.raises(json.JSONDecodeError):
+        json.loads(text)
+    with pytest.raises(json.JSONDecodeError):
+        parse_stream(converter, text, chunk_size)
+
+
+def test_stream_parser_events(converter):
+    events = list(converter.iter_json_events(io.StringIO('{"a": [1, {"b": null}]}'), chunk_size=4))
+    assert events == [
+        ('start_map', None), ('map_key', 'a'), ('start_array', None), ('value', 1),
+        ('start_map', None), ('map_key', 'b'), ('value', None), ('end_map', None),
+        ('end_array', None), ('end_map', None),
+    ]
+
+
+def test_stream_parser_reports_offset(converter):
+    with pytest.raises(json.JSONDecodeError) as info:
+        parse_stream(converter, '[1, 2,]', 2)
+    assert info.value.pos == 6
+
+
+def pdf_text(data):
+    pypdf = pytest.importorskip('pypdf')
+    return ''.join(page.extract_text() for page in pypdf.PdfReader(io.BytesIO(data)).pages)
+
+
+def test_streamed_table_keeps_keys_first_seen_after_lookahead(converter):
+    rows = [{'id': index} for index in range(30)]
+    rows.insert(20, {'id': 'LATEROW', 'late_col': 'LATEVALUE'})
+    text = json.dumps({'rows': rows, 'after': 'TAIL'})
+
+    streamed = converter.JsonPdfRenderer(streaming=True, incremental=True, lookahead=10).render_json(io.StringIO(text))
+    loaded = converter.JsonPdfRenderer().render_json(io.StringIO(text))
+
+    for data in (streamed, loaded):
+        content = pdf_text(data)
+        assert 'LATEVALUE' in content
+        assert 'late_col' in content
+        assert 'TAIL' in content
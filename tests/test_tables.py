@@ -0,0 +1,52 @@
+"""Tests for table cell formatting and column order in Json-to-pdf.py"""
+import pytest
+
+
+@pytest.mark.parametrize('header, types, expected', [
+    ('cost', {int, float}, '_format_money_column'),
+    ('Total Budget', {int, type(None)}, '_format_money_column'),
+    ('cost', {int, str}, '_format_mixed_money_column'),
+    ('budget', {bool, float}, '_format_mixed_money_column'),
+    ('cost', None, '_format_mixed_money_column'),
+    ('name', {str, type(None)}, '_format_string_column'),
+    ('name', {str, int}, '_format_text_column'),
+    ('count', {int}, '_format_text_column'),
+    ('name', None, '_format_text_column'),
+])
+def test_column_formatter_choice(converter, header, types, expected):
+    assert converter.column_formatter(header, types) is getattr(converter, expected)
+
+
+def test_money_column(converter):
+    assert converter._format_money_column([1234567, 2.5, None, 0]) == ['$1,234,567', '$2.5', '', '']
+
+
+def test_mixed_money_column_keeps_strings_and_bools(converter):
+    values = [1500, 'n/a', True, False, None, 12.25]
+    assert converter._format_mixed_money_column(values) == ['$1,500', 'n/a', 'True', '', '', '$12.25']
+
+
+def test_string_and_text_columns(converter):
+    assert converter._format_string_column(['a', None, '']) == ['a', '', '']
+    assert converter._format_text_column([1, 2.5, 'x', None, [1, 2], {'k': 1}]) == [
+        '1', '2.5', 'x', '', '[1, 2]', "{'k': 1}"]
+
+
+def test_format_table_rows(converter):
+    items = [
+        {'name': 'alpha', 'budget': 'TBD', 'count': 3},
+        {'name': 'beta', 'budget': 2000},
+        {'count': 7, 'extra': 'ignored'},
+    ]
+    rows = converter.format_table_rows(items, ['name', 'budget', 'count'])
+    assert rows == [('alpha', 'TBD', '3'), ('beta', '$2,000', ''), ('', '', '7')]
+    assert all(type(row) is tuple for row in rows)
+
+
+def test_columns_follow_first_appearance(converter):
+    renderer = converter.JsonPdfRenderer()
+    builder = converter._StoryBuilder(renderer, 500)
+    table = builder.table_from_list([{'b': 1, 'a': 2}, {'c': 3, 'a': 4}, {'d': 5, 'b': 6}])[0]
+    assert list(table._cellvalues[0]) == ['b', 'a', 'c', 'd']
+    assert [list(row) for row in table._cellvalues[1:]] == [
+        ['1', '2', '', ''], ['', '4', '3', ''], ['6', '', '', '5']]